@@ -5,37 +5,267 @@ Sends notifications via email and SMS.
 """
 
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.header import Header
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
+from contextlib import contextmanager, nullcontext
+from operator import itemgetter
+import base64
+import copy
+import uuid
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from twilio.rest import Client as _TwilioClient
+except ImportError:
+    _TwilioClient = None
+
+# Parsed config per path, keyed on file mtime so edits are picked up
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
+def _load_config(config_path: str) -> Dict:
+    """Load a YAML config, reusing the parsed copy while the file is unchanged."""
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        with open(config_path, 'r') as f:
+            cached = (mtime, yaml.load(f, Loader=_YamlLoader))
+        _CONFIG_CACHE[config_path] = cached
+    return copy.deepcopy(cached[1])
+
+
+_SIGNAL_EMOJI = {
+    'STRONG BUY': '🟢🟢',
+    'BUY': '🟢',
+    'HOLD': '🟡',
+    'SELL': '🔴',
+    'STRONG SELL': '🔴🔴'
+}
+
+# Color coding for the HTML email
+_REGIME_COLORS = {
+    'BULLISH': '#22c55e',
+    'NEUTRAL': '#eab308',
+    'BEARISH': '#ef4444',
+    'CRASH': '#7f1d1d'
+}
+
+_SIGNAL_COLORS = {
+    'STRONG BUY': '#15803d',
+    'BUY': '#22c55e',
+    'HOLD': '#6b7280',
+    'SELL': '#ef4444',
+    'STRONG SELL': '#991b1b'
+}
+
+# Static head of the HTML email (styles and title bar); plain string, not formatted
+_HTML_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f3f4f6; padding: 20px; }
+                .container { max-width: 800px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+                .header { background: #1f2937; color: white; padding: 20px; }
+                .header h1 { margin: 0; font-size: 24px; }
+                .regime { display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: bold; margin-top: 10px; }
+                .market-info { padding: 15px 20px; background: #f9fafb; border-bottom: 1px solid #e5e7eb; }
+                .market-info span { margin-right: 20px; }
+                .signals { padding: 20px; }
+                .signal-card { border: 1px solid #e5e7eb; border-radius: 8px; padding: 15px; margin-bottom: 15px; }
+                .signal-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }
+                .ticker { font-size: 20px; font-weight: bold; }
+                .signal-badge { padding: 4px 12px; border-radius: 4px; color: white; font-weight: bold; font-size: 14px; }
+                .details { display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; font-size: 14px; }
+                .detail { }
+                .detail-label { color: #6b7280; font-size: 12px; }
+                .detail-value { font-weight: 500; }
+                .positive { color: #22c55e; }
+                .negative { color: #ef4444; }
+                .indicators { margin-top: 10px; padding-top: 10px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }
+                .summary { padding: 20px; background: #f9fafb; }
+                .summary-group { margin-bottom: 10px; }
+                .summary-label { font-weight: bold; margin-right: 10px; }
+                .footer { padding: 15px 20px; text-align: center; color: #6b7280; font-size: 12px; border-top: 1px solid #e5e7eb; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📊 Stock Signal Report</h1>"""
+
+# Compact report used when a run produced no signals at all
+_EMPTY_REPORT_HTML = """<!DOCTYPE html>
+<html>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
+    <h1 style="font-size: 24px;">📊 Stock Signal Report</h1>
+    <p><strong style="color: {regime_color};">{regime} MARKET</strong></p>
+    <p>No signals were generated for this run.</p>
+    <p style="color: #6b7280; font-size: 12px;">Generated at {generated_at}<br>
+    <em>This is not financial advice. Always do your own research.</em></p>
+</body>
+</html>
+"""
+
+# Per-signal card in the HTML email; filled with str.format from a flat signal view
+_SIGNAL_CARD_HTML = """
+                    <div class="signal-card">
+                        <div class="signal-header">
+                            <div>
+                                <span class="ticker">{ticker}</span>
+                                <span style="color: #6b7280; font-size: 14px; margin-left: 8px;">{sector}</span>
+                            </div>
+                            <span class="signal-badge" style="background: {badge_color};">
+                                {signal}
+                            </span>
+                        </div>
+                        
+                        <div class="details">
+                            <div class="detail">
+                                <div class="detail-label">Price</div>
+                                <div class="detail-value">${current_price} <span class="{change_class}">({daily_change:+.2f}%)</span></div>
+                            </div>
+                            <div class="detail">
+                                <div class="detail-label">Confidence</div>
+                                <div class="detail-value">{confidence}%</div>
+                            </div>
+                            <div class="detail">
+                                <div class="detail-label">Score</div>
+                                <div class="detail-value">{composite_score:.3f}</div>
+                            </div>
+                            <div class="detail">
+                                <div class="detail-label">Buy Range</div>
+                                <div class="detail-value">{buy_range}</div>
+                            </div>
+                            <div class="detail">
+                                <div class="detail-label">Sell Range</div>
+                                <div class="detail-value">{sell_range}</div>
+                            </div>
+                            <div class="detail">
+                                <div class="detail-label">Support / Resist</div>
+                                <div class="detail-value">${support} / ${resistance}</div>
+                            </div>
+                        </div>
+                        
+                        <div class="indicators">
+                            RSI: {rsi} | 
+                            MACD Hist: {macd_hist:.4f} | 
+                            BB%: {bb_position:.0f}% |
+                            vs 50MA: {vs_sma50:+.1f}% |
+                            Vol Ratio: {volume_ratio:.1f}x
+                        </div>
+                    </div>
+            """
+
+
+# Pre-written multipart/alternative message for the report email, filled in and
+# handed to sendmail as bytes without building MIME objects.
+_EMAIL_TEMPLATE = (
+    'Content-Type: multipart/alternative; boundary="{boundary}"\r\n'
+    'MIME-Version: 1.0\r\n'
+    'Subject: {subject}\r\n'
+    'From: {sender}\r\n'
+    'To: {recipients}\r\n'
+    '\r\n'
+    '--{boundary}\r\n'
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    'Content-Transfer-Encoding: {encoding}\r\n'
+    '\r\n'
+    '{text}'
+    '--{boundary}\r\n'
+    'Content-Type: text/html; charset="utf-8"\r\n'
+    'Content-Transfer-Encoding: {encoding}\r\n'
+    '\r\n'
+    '{html}'
+    '--{boundary}--\r\n'
+)
+
+
+def _encode_body(text: str, eightbit: bool) -> str:
+    """Prepare a body for _EMAIL_TEMPLATE as CRLF-terminated lines.
+    
+    With 8BITMIME the UTF-8 text goes out as-is; otherwise it is base64-encoded,
+    which costs a third more bytes on the wire.
+    """
+    if eightbit:
+        return text.replace('\r\n', '\n').rstrip('\n').replace('\n', '\r\n') + '\r\n'
+    return base64.encodebytes(text.encode('utf-8')).decode('ascii').replace('\n', '\r\n')
+
+
+def _signal_view(signal: Dict) -> Dict:
+    """Flatten a signal into the fields used by _SIGNAL_CARD_HTML."""
+    indicators = signal['indicators']
+    return {
+        'ticker': signal['ticker'],
+        'sector': signal['sector'],
+        'signal': signal['signal'],
+        'badge_color': _SIGNAL_COLORS.get(signal['signal'], '#6b7280'),
+        'change_class': 'positive' if signal['daily_change'] >= 0 else 'negative',
+        'current_price': signal['current_price'],
+        'daily_change': signal['daily_change'],
+        'confidence': signal['confidence'],
+        'composite_score': signal['composite_score'],
+        'buy_range': signal['buy_range'],
+        'sell_range': signal['sell_range'],
+        'support': signal['support'],
+        'resistance': signal['resistance'],
+        'rsi': indicators['rsi'],
+        'macd_hist': indicators['macd_hist'],
+        'bb_position': indicators['bb_position'],
+        'vs_sma50': indicators['vs_sma50'],
+        'volume_ratio': indicators['volume_ratio']
+    }
+
+
+def _iter_signal_html(signals: List[Dict]) -> Iterator[str]:
+    """Yield the HTML card for each signal, one at a time."""
+    for signal in signals:
+        yield _SIGNAL_CARD_HTML.format(**_signal_view(signal))
+
+
+def _join_summary(summary: Dict) -> Dict[str, str]:
+    """Comma-join the actionable summary buckets, with 'None' for empty ones."""
+    return {k: ', '.join(summary[k]) or 'None' for k in ('strong_buy', 'buy', 'sell', 'strong_sell')}
+
 
 class AlertManager:
     """Manages sending alerts via email and SMS."""
     
     def __init__(self, config_path: str = 'config.yaml'):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
-        
-        self.alert_config = self.config.get('alerts', {})
-        
+        self._config_path = config_path
+    
+    @cached_property
+    def config(self) -> Dict:
+        """Full config, read on first access."""
+        return _load_config(self._config_path)
+    
+    @cached_property
+    def alert_config(self) -> Dict:
+        """The 'alerts' section of the config."""
+        return self.config.get('alerts', {})
+    
+    @cached_property
+    def _twilio_client(self):
+        """Twilio REST client, created on first send and reused afterwards."""
+        twilio_config = self.alert_config.get('twilio', {})
+        return _TwilioClient(twilio_config['account_sid'], twilio_config['auth_token'])
+    
     def _format_signal_text(self, signal: Dict) -> str:
         """Format a single signal for text display."""
-        emoji = {
-            'STRONG BUY': '🟢🟢',
-            'BUY': '🟢',
-            'HOLD': '🟡',
-            'SELL': '🔴',
-            'STRONG SELL': '🔴🔴'
-        }
-        
         return (
-            f"{emoji.get(signal['signal'], '⚪')} {signal['ticker']}: {signal['signal']}\n"
+            f"{_SIGNAL_EMOJI.get(signal['signal'], '⚪')} {signal['ticker']}: {signal['signal']}\n"
             f"   Price: ${signal['current_price']} ({signal['daily_change']:+.2f}%)\n"
             f"   Confidence: {signal['confidence']}%\n"
             f"   Buy Range: {signal['buy_range']}\n"
@@ -63,65 +293,22 @@ class AlertManager:
         
         return '\n'.join(lines)
     
-    def _format_email_html(self, results: Dict) -> str:
-        """Format full HTML email report."""
+    def _format_email_html(self, results: Dict, joined: Optional[Dict[str, str]] = None) -> str:
+        """Format full HTML email report. Expects signals sorted by composite score."""
         regime = results['market_regime']
-        signals = results['signals']
         
-        # Color coding
-        regime_colors = {
-            'BULLISH': '#22c55e',
-            'NEUTRAL': '#eab308',
-            'BEARISH': '#ef4444',
-            'CRASH': '#7f1d1d'
-        }
-        
-        signal_colors = {
-            'STRONG BUY': '#15803d',
-            'BUY': '#22c55e',
-            'HOLD': '#6b7280',
-            'SELL': '#ef4444',
-            'STRONG SELL': '#991b1b'
-        }
+        if not results['signals'] and not any(results['summary'].values()):
+            return _EMPTY_REPORT_HTML.format(
+                regime=regime['regime'],
+                regime_color=_REGIME_COLORS.get(regime['regime'], '#6b7280'),
+                generated_at=results['generated_at']
+            )
         
-        # Sort signals by composite score
-        sorted_signals = sorted(signals, key=lambda x: x['composite_score'], reverse=True)
+        if joined is None:
+            joined = _join_summary(results['summary'])
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f3f4f6; padding: 20px; }}
-                .container {{ max-width: 800px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .header {{ background: #1f2937; color: white; padding: 20px; }}
-                .header h1 {{ margin: 0; font-size: 24px; }}
-                .regime {{ display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: bold; margin-top: 10px; }}
-                .market-info {{ padding: 15px 20px; background: #f9fafb; border-bottom: 1px solid #e5e7eb; }}
-                .market-info span {{ margin-right: 20px; }}
-                .signals {{ padding: 20px; }}
-                .signal-card {{ border: 1px solid #e5e7eb; border-radius: 8px; padding: 15px; margin-bottom: 15px; }}
-                .signal-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }}
-                .ticker {{ font-size: 20px; font-weight: bold; }}
-                .signal-badge {{ padding: 4px 12px; border-radius: 4px; color: white; font-weight: bold; font-size: 14px; }}
-                .details {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; font-size: 14px; }}
-                .detail {{ }}
-                .detail-label {{ color: #6b7280; font-size: 12px; }}
-                .detail-value {{ font-weight: 500; }}
-                .positive {{ color: #22c55e; }}
-                .negative {{ color: #ef4444; }}
-                .indicators {{ margin-top: 10px; padding-top: 10px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }}
-                .summary {{ padding: 20px; background: #f9fafb; }}
-                .summary-group {{ margin-bottom: 10px; }}
-                .summary-label {{ font-weight: bold; margin-right: 10px; }}
-                .footer {{ padding: 15px 20px; text-align: center; color: #6b7280; font-size: 12px; border-top: 1px solid #e5e7eb; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📊 Stock Signal Report</h1>
-                    <div class="regime" style="background: {regime_colors.get(regime['regime'], '#6b7280')};">
+        parts = [_HTML_HEAD, f"""
+                    <div class="regime" style="background: {_REGIME_COLORS.get(regime['regime'], '#6b7280')};">
                         {regime['regime']} MARKET
                     </div>
                 </div>
@@ -135,79 +322,29 @@ class AlertManager:
                 <div class="summary">
                     <div class="summary-group">
                         <span class="summary-label" style="color: #15803d;">🟢🟢 STRONG BUY:</span>
-                        {', '.join(results['summary']['strong_buy']) or 'None'}
+                        {joined['strong_buy']}
                     </div>
                     <div class="summary-group">
                         <span class="summary-label" style="color: #22c55e;">🟢 BUY:</span>
-                        {', '.join(results['summary']['buy']) or 'None'}
+                        {joined['buy']}
                     </div>
                     <div class="summary-group">
                         <span class="summary-label" style="color: #ef4444;">🔴 SELL:</span>
-                        {', '.join(results['summary']['sell']) or 'None'}
+                        {joined['sell']}
                     </div>
                     <div class="summary-group">
                         <span class="summary-label" style="color: #991b1b;">🔴🔴 STRONG SELL:</span>
-                        {', '.join(results['summary']['strong_sell']) or 'None'}
+                        {joined['strong_sell']}
                     </div>
                 </div>
                 
                 <div class="signals">
                     <h2 style="margin-top: 0;">Detailed Signals</h2>
-        """
+        """]
         
-        for signal in sorted_signals:
-            change_class = 'positive' if signal['daily_change'] >= 0 else 'negative'
-            
-            html += f"""
-                    <div class="signal-card">
-                        <div class="signal-header">
-                            <div>
-                                <span class="ticker">{signal['ticker']}</span>
-                                <span style="color: #6b7280; font-size: 14px; margin-left: 8px;">{signal['sector']}</span>
-                            </div>
-                            <span class="signal-badge" style="background: {signal_colors.get(signal['signal'], '#6b7280')};">
-                                {signal['signal']}
-                            </span>
-                        </div>
-                        
-                        <div class="details">
-                            <div class="detail">
-                                <div class="detail-label">Price</div>
-                                <div class="detail-value">${signal['current_price']} <span class="{change_class}">({signal['daily_change']:+.2f}%)</span></div>
-                            </div>
-                            <div class="detail">
-                                <div class="detail-label">Confidence</div>
-                                <div class="detail-value">{signal['confidence']}%</div>
-                            </div>
-                            <div class="detail">
-                                <div class="detail-label">Score</div>
-                                <div class="detail-value">{signal['composite_score']:.3f}</div>
-                            </div>
-                            <div class="detail">
-                                <div class="detail-label">Buy Range</div>
-                                <div class="detail-value">{signal['buy_range']}</div>
-                            </div>
-                            <div class="detail">
-                                <div class="detail-label">Sell Range</div>
-                                <div class="detail-value">{signal['sell_range']}</div>
-                            </div>
-                            <div class="detail">
-                                <div class="detail-label">Support / Resist</div>
-                                <div class="detail-value">${signal['support']} / ${signal['resistance']}</div>
-                            </div>
-                        </div>
-                        
-                        <div class="indicators">
-                            RSI: {signal['indicators']['rsi']} | 
-                            MACD Hist: {signal['indicators']['macd_hist']:.4f} | 
-                            BB%: {signal['indicators']['bb_position']:.0f}% |
-                            vs 50MA: {signal['indicators']['vs_sma50']:+.1f}% |
-                            Vol Ratio: {signal['indicators']['volume_ratio']:.1f}x
-                        </div>
-                    </div>
-            """
+        parts.extend(_iter_signal_html(results['signals']))
         
-        html += f"""
+        parts.append(f"""
                 </div>
                 
                 <div class="footer">
@@ -217,12 +354,22 @@ class AlertManager:
             </div>
         </body>
         </html>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
-    def send_email(self, results: Dict, attach_html: bool = True) -> bool:
-        """Send email alert with full report."""
+    @contextmanager
+    def _smtp_session(self):
+        """Open an authenticated SMTP connection using the email settings."""
+        email_config = self.alert_config.get('email', {})
+        
+        with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
+            server.starttls()
+            server.login(email_config['sender_email'], email_config['sender_password'])
+            yield server
+    
+    def send_email(self, results: Dict, attach_html: bool = True, server: Optional[smtplib.SMTP] = None) -> bool:
+        """Send email alert with full report. Reuses `server` if given."""
         email_config = self.alert_config.get('email', {})
         
         if not email_config.get('enabled', False):
@@ -230,32 +377,45 @@ class AlertManager:
             return False
         
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"📊 Stock Signals - {results['market_regime']['regime']} Market - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            msg['From'] = email_config['sender_email']
-            msg['To'] = ', '.join(email_config['recipient_emails'])
+            # Sort once by composite score; both text and HTML bodies use this order
+            results = dict(results, signals=sorted(results['signals'], key=itemgetter('composite_score'), reverse=True))
             
-            # Plain text version
-            text_content = f"Market Regime: {results['market_regime']['regime']}\n\n"
-            text_content += f"STRONG BUY: {', '.join(results['summary']['strong_buy']) or 'None'}\n"
-            text_content += f"BUY: {', '.join(results['summary']['buy']) or 'None'}\n"
-            text_content += f"SELL: {', '.join(results['summary']['sell']) or 'None'}\n"
-            text_content += f"STRONG SELL: {', '.join(results['summary']['strong_sell']) or 'None'}\n\n"
-            
-            for signal in results['signals']:
-                text_content += self._format_signal_text(signal) + "\n"
+            joined = _join_summary(results['summary'])
+            subject = f"📊 Stock Signals - {results['market_regime']['regime']} Market - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
             
-            msg.attach(MIMEText(text_content, 'plain'))
+            # Plain text version
+            text_parts = [
+                f"Market Regime: {results['market_regime']['regime']}\n\n",
+                f"STRONG BUY: {joined['strong_buy']}\n",
+                f"BUY: {joined['buy']}\n",
+                f"SELL: {joined['sell']}\n",
+                f"STRONG SELL: {joined['strong_sell']}\n\n"
+            ]
+            text_parts.extend(self._format_signal_text(signal) + "\n" for signal in results['signals'])
+            text_content = "".join(text_parts)
             
             # HTML version
-            html_content = self._format_email_html(results)
-            msg.attach(MIMEText(html_content, 'html'))
+            html_content = self._format_email_html(results, joined=joined)
             
             # Send
-            with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
-                server.starttls()
-                server.login(email_config['sender_email'], email_config['sender_password'])
-                server.send_message(msg)
+            with nullcontext(server) if server is not None else self._smtp_session() as session:
+                # 8-bit bodies skip base64 expansion when the server accepts them
+                eightbit = session.has_extn('8bitmime')
+                raw = _EMAIL_TEMPLATE.format(
+                    boundary=f"=={uuid.uuid4().hex}==",
+                    subject=Header(subject, 'utf-8').encode(linesep='\r\n'),
+                    sender=email_config['sender_email'],
+                    recipients=', '.join(email_config['recipient_emails']),
+                    encoding='8bit' if eightbit else 'base64',
+                    text=_encode_body(text_content, eightbit),
+                    html=_encode_body(html_content, eightbit)
+                ).encode('utf-8')
+                session.sendmail(
+                    email_config['sender_email'],
+                    email_config['recipient_emails'],
+                    raw,
+                    mail_options=['BODY=8BITMIME'] if eightbit else []
+                )
             
             print(f"✅ Email sent to {len(email_config['recipient_emails'])} recipients")
             return True
@@ -264,8 +424,8 @@ class AlertManager:
             print(f"❌ Email failed: {e}")
             return False
     
-    def send_sms_via_email(self, results: Dict) -> bool:
-        """Send SMS via email-to-SMS gateway."""
+    def send_sms_via_email(self, results: Dict, server: Optional[smtplib.SMTP] = None) -> bool:
+        """Send SMS via email-to-SMS gateway. Reuses `server` if given."""
         sms_config = self.alert_config.get('sms', {})
         email_config = self.alert_config.get('email', {})
         
@@ -279,19 +439,18 @@ class AlertManager:
         
         try:
             brief = self._format_sms_brief(results)
+            recipients = sms_config.get('recipients', [])
             
-            for recipient in sms_config.get('recipients', []):
-                msg = MIMEText(brief)
-                msg['Subject'] = 'Stock Alert'
-                msg['From'] = email_config['sender_email']
-                msg['To'] = recipient
-                
-                with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
-                    server.starttls()
-                    server.login(email_config['sender_email'], email_config['sender_password'])
-                    server.send_message(msg)
+            # Same body for everyone, so let the server fan out one message
+            msg = MIMEText(brief)
+            msg['Subject'] = 'Stock Alert'
+            msg['From'] = email_config['sender_email']
+            msg['To'] = ', '.join(recipients)
+            
+            with nullcontext(server) if server is not None else self._smtp_session() as session:
+                session.send_message(msg, to_addrs=recipients)
             
-            print(f"✅ SMS sent to {len(sms_config['recipients'])} recipients")
+            print(f"✅ SMS sent to {len(recipients)} recipients")
             return True
             
         except Exception as e:
@@ -305,33 +464,67 @@ class AlertManager:
         if not twilio_config.get('enabled', False):
             return False
         
+        if _TwilioClient is None:
+            print("❌ Twilio not installed. Run: pip install twilio")
+            return False
+        
         try:
-            from twilio.rest import Client
-            
-            client = Client(twilio_config['account_sid'], twilio_config['auth_token'])
+            client = self._twilio_client
             brief = self._format_sms_brief(results)
+            to_numbers = twilio_config.get('to_numbers', [])
             
-            for to_number in twilio_config.get('to_numbers', []):
-                message = client.messages.create(
+            def send(to_number):
+                return client.messages.create(
                     body=brief,
                     from_=twilio_config['from_number'],
                     to=to_number
                 )
-                print(f"✅ Twilio SMS sent: {message.sid}")
+            
+            # Each send is an independent HTTPS round trip; the client is thread-safe
+            if to_numbers:
+                with ThreadPoolExecutor(max_workers=min(8, len(to_numbers))) as executor:
+                    for message in executor.map(send, to_numbers):
+                        print(f"✅ Twilio SMS sent: {message.sid}")
             
             return True
             
-        except ImportError:
-            print("❌ Twilio not installed. Run: pip install twilio")
-            return False
         except Exception as e:
             print(f"❌ Twilio SMS failed: {e}")
             return False
     
+    def _send_smtp_alerts(self, results: Dict) -> Tuple[bool, bool]:
+        """Send email and SMS gateway alerts, sharing one SMTP session when both are on."""
+        email_enabled = self.alert_config.get('email', {}).get('enabled', False)
+        sms_enabled = self.alert_config.get('sms', {}).get('enabled', False)
+        
+        if not (email_enabled and sms_enabled):
+            return self.send_email(results), self.send_sms_via_email(results)
+        
+        # A failure while closing the session must not mark sent alerts as failed
+        email_sent = sms_sent = False
+        try:
+            with self._smtp_session() as server:
+                email_sent = self.send_email(results, server=server)
+                sms_sent = self.send_sms_via_email(results, server=server)
+        except Exception as e:
+            print(f"❌ SMTP connection failed: {e}")
+        return email_sent, sms_sent
+    
     def send_all_alerts(self, results: Dict) -> Dict[str, bool]:
-        """Send all configured alerts."""
+        """Send all configured alerts, running the independent channels concurrently."""
+        try:
+            self.alert_config
+        except (OSError, yaml.YAMLError) as e:
+            print(f"❌ Could not load alert config {self._config_path}: {e}")
+            return {'email': False, 'sms_gateway': False, 'twilio': False}
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            smtp_future = executor.submit(self._send_smtp_alerts, results)
+            twilio_future = executor.submit(self.send_twilio_sms, results)
+        
+        email_sent, sms_sent = smtp_future.result()
         return {
-            'email': self.send_email(results),
-            'sms_gateway': self.send_sms_via_email(results),
-            'twilio': self.send_twilio_sms(results)
+            'email': email_sent,
+            'sms_gateway': sms_sent,
+            'twilio': twilio_future.result()
         }
@@ -5,48 +5,56 @@ Generates a static HTML dashboard for viewing signals.
 Features: Clickable tickers, auto-refresh, manual refresh button, CALL options only
 """
 
-from typing import Dict
+from typing import Callable, Dict, Iterator, List
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from operator import itemgetter
+from string import Formatter, Template
+import gzip
+import hashlib
 import json
+import math
+import os
+import re
 
+import numpy as np
 
-def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', options_data: list = None) -> str:
-    """Generate a static HTML dashboard with all signal data."""
-    
-    regime = results['market_regime']
-    signals = results['signals']
-    
-    # Sort signals by composite score
-    sorted_signals = sorted(signals, key=lambda x: x['composite_score'], reverse=True)
-    
-    # Prepare options data
-    options_json = json.dumps(options_data if options_data else [])
-    
-    # Convert to JSON for JavaScript
-    signals_json = json.dumps(sorted_signals)
-    regime_json = json.dumps(regime)
-    summary_json = json.dumps(results['summary'])
-    
-    html = f"""<!DOCTYPE html>
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:
+    rcssmin = rjsmin = None
+
+
+# Page fragments, assembled in order by generate_dashboard. The small
+# dynamic fragments are string.Templates filled with pre-formatted values; the
+# large CSS and JS blocks are plain strings with __PLACEHOLDER__ markers.
+_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Stock Signal Dashboard</title>
-    <meta http-equiv="refresh" content="300">
     <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
+"""
+
+_CSS = """        * { box-sizing: border-box; margin: 0; padding: 0; }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: #0f172a;
             color: #e2e8f0;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
+        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
         
-        header {{
+        header {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -55,24 +63,24 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             margin-bottom: 20px;
             flex-wrap: wrap;
             gap: 15px;
-        }}
+        }
         
-        .header-left {{
+        .header-left {
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
         
-        .header-right {{
+        .header-right {
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
         
-        h1 {{ font-size: 28px; font-weight: 600; }}
-        .timestamp {{ color: #94a3b8; font-size: 14px; }}
+        h1 { font-size: 28px; font-weight: 600; }
+        .timestamp { color: #94a3b8; font-size: 14px; }
         
-        .refresh-btn {{
+        .refresh-btn {
             background: #3b82f6;
             color: white;
             border: none;
@@ -85,70 +93,70 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             align-items: center;
             gap: 8px;
             transition: background 0.2s;
-        }}
+        }
         
-        .refresh-btn:hover {{
+        .refresh-btn:hover {
             background: #2563eb;
-        }}
+        }
         
-        .refresh-btn:active {{
+        .refresh-btn:active {
             transform: scale(0.98);
-        }}
+        }
         
-        .refresh-btn.loading {{
+        .refresh-btn.loading {
             opacity: 0.7;
             cursor: not-allowed;
-        }}
+        }
         
-        .refresh-icon {{
+        .refresh-icon {
             display: inline-block;
             transition: transform 0.3s;
-        }}
+        }
         
-        .refresh-btn.loading .refresh-icon {{
+        .refresh-btn.loading .refresh-icon {
             animation: spin 1s linear infinite;
-        }}
+        }
         
-        @keyframes spin {{
-            from {{ transform: rotate(0deg); }}
-            to {{ transform: rotate(360deg); }}
-        }}
+        @keyframes spin {
+            from { transform: rotate(0deg); }
+            to { transform: rotate(360deg); }
+        }
         
-        .auto-refresh-note {{
+        .auto-refresh-note {
             font-size: 12px;
             color: #64748b;
-        }}
+        }
         
-        .market-banner {{
+        .market-banner {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-bottom: 25px;
-        }}
+        }
         
-        .market-card {{
+        .market-card {
             background: #1e293b;
             border-radius: 12px;
             padding: 20px;
             border: 1px solid #334155;
-        }}
+        }
         
-        .market-card.regime {{
+        .market-card.regime {
             border-left: 4px solid;
-        }}
+        }
         
-        .market-card.regime.BULLISH {{ border-left-color: #22c55e; background: linear-gradient(135deg, #1e293b 0%, #14532d33 100%); }}
-        .market-card.regime.NEUTRAL {{ border-left-color: #eab308; background: linear-gradient(135deg, #1e293b 0%, #71380033 100%); }}
-        .market-card.regime.BEARISH {{ border-left-color: #ef4444; background: linear-gradient(135deg, #1e293b 0%, #7f1d1d33 100%); }}
-        .market-card.regime.CRASH {{ border-left-color: #dc2626; background: linear-gradient(135deg, #1e293b 0%, #450a0a33 100%); }}
+        .market-card.regime.BULLISH { border-left-color: #22c55e; background: linear-gradient(135deg, #1e293b 0%, #14532d33 100%); }
+        .market-card.regime.NEUTRAL { border-left-color: #eab308; background: linear-gradient(135deg, #1e293b 0%, #71380033 100%); }
+        .market-card.regime.BEARISH { border-left-color: #ef4444; background: linear-gradient(135deg, #1e293b 0%, #7f1d1d33 100%); }
+        .market-card.regime.CRASH { border-left-color: #dc2626; background: linear-gradient(135deg, #1e293b 0%, #450a0a33 100%); }
         
-        .market-label {{ font-size: 12px; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.5px; }}
-        .market-value {{ font-size: 24px; font-weight: 600; margin-top: 5px; }}
-        .market-change {{ font-size: 14px; margin-top: 5px; }}
-        .market-change.positive {{ color: #22c55e; }}
-        .market-change.negative {{ color: #ef4444; }}
+        .market-label { font-size: 12px; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.5px; }
+        .market-value { font-size: 24px; font-weight: 600; margin-top: 5px; }
+        .market-change { font-size: 14px; margin-top: 5px; }
+        .market-change.positive { color: #22c55e; }
+        .market-change.negative { color: #ef4444; }
         
-        .summary-bar {{
+        .summary-bar {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
@@ -157,37 +165,37 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             background: #1e293b;
             border-radius: 12px;
             border: 1px solid #334155;
-        }}
+        }
         
-        .summary-group {{
+        .summary-group {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .summary-label {{
+        .summary-label {
             font-size: 12px;
             font-weight: 600;
             padding: 4px 10px;
             border-radius: 4px;
-        }}
+        }
         
-        .summary-label.strong-buy {{ background: #14532d; color: #86efac; }}
-        .summary-label.buy {{ background: #166534; color: #bbf7d0; }}
-        .summary-label.hold {{ background: #374151; color: #9ca3af; }}
-        .summary-label.sell {{ background: #991b1b; color: #fecaca; }}
-        .summary-label.strong-sell {{ background: #7f1d1d; color: #fca5a5; }}
+        .summary-label.strong-buy { background: #14532d; color: #86efac; }
+        .summary-label.buy { background: #166534; color: #bbf7d0; }
+        .summary-label.hold { background: #374151; color: #9ca3af; }
+        .summary-label.sell { background: #991b1b; color: #fecaca; }
+        .summary-label.strong-sell { background: #7f1d1d; color: #fca5a5; }
         
-        .summary-tickers {{ font-size: 14px; color: #cbd5e1; }}
+        .summary-tickers { font-size: 14px; color: #cbd5e1; }
         
-        .filters {{
+        .filters {
             display: flex;
             gap: 10px;
             margin-bottom: 20px;
             flex-wrap: wrap;
-        }}
+        }
         
-        .filter-btn {{
+        .filter-btn {
             background: #1e293b;
             border: 1px solid #334155;
             color: #e2e8f0;
@@ -196,21 +204,21 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             cursor: pointer;
             font-size: 14px;
             transition: all 0.2s;
-        }}
+        }
         
-        .filter-btn:hover {{ background: #334155; }}
-        .filter-btn.active {{ background: #3b82f6; border-color: #3b82f6; }}
+        .filter-btn:hover { background: #334155; }
+        .filter-btn.active { background: #3b82f6; border-color: #3b82f6; }
         
-        .signals-table {{
+        .signals-table {
             width: 100%;
             border-collapse: collapse;
             background: #1e293b;
             border-radius: 12px;
             overflow: hidden;
             border: 1px solid #334155;
-        }}
+        }
         
-        .signals-table th {{
+        .signals-table th {
             background: #0f172a;
             padding: 15px;
             text-align: left;
@@ -220,196 +228,196 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             letter-spacing: 0.5px;
             color: #94a3b8;
             border-bottom: 1px solid #334155;
-        }}
+        }
         
-        .signals-table td {{
+        .signals-table td {
             padding: 15px;
             border-bottom: 1px solid #1e293b;
-        }}
+        }
         
-        .signals-table tr:hover {{ background: #334155; }}
+        .signals-table tr:hover { background: #334155; }
         
-        .ticker-cell {{
+        .ticker-cell {
             font-weight: 600;
             font-size: 16px;
-        }}
+        }
         
-        .ticker-link {{
+        .ticker-link {
             color: #60a5fa;
             cursor: pointer;
             text-decoration: none;
             transition: color 0.2s;
-        }}
+        }
         
-        .ticker-link:hover {{
+        .ticker-link:hover {
             color: #93c5fd;
             text-decoration: underline;
-        }}
+        }
         
-        .sector-badge {{
+        .sector-badge {
             font-size: 11px;
             color: #94a3b8;
             background: #0f172a;
             padding: 2px 8px;
             border-radius: 4px;
             margin-left: 8px;
-        }}
+        }
         
-        .signal-badge {{
+        .signal-badge {
             display: inline-block;
             padding: 6px 12px;
             border-radius: 6px;
             font-weight: 600;
             font-size: 12px;
             text-transform: uppercase;
-        }}
+        }
         
-        .signal-badge.strong-buy {{ background: #14532d; color: #86efac; }}
-        .signal-badge.buy {{ background: #166534; color: #bbf7d0; }}
-        .signal-badge.hold {{ background: #374151; color: #9ca3af; }}
-        .signal-badge.sell {{ background: #991b1b; color: #fecaca; }}
-        .signal-badge.strong-sell {{ background: #7f1d1d; color: #fca5a5; }}
+        .signal-badge.strong-buy { background: #14532d; color: #86efac; }
+        .signal-badge.buy { background: #166534; color: #bbf7d0; }
+        .signal-badge.hold { background: #374151; color: #9ca3af; }
+        .signal-badge.sell { background: #991b1b; color: #fecaca; }
+        .signal-badge.strong-sell { background: #7f1d1d; color: #fca5a5; }
         
-        .price-cell {{ font-family: 'SF Mono', Monaco, monospace; }}
+        .price-cell { font-family: 'SF Mono', Monaco, monospace; }
         
-        .change-positive {{ color: #22c55e; }}
-        .change-negative {{ color: #ef4444; }}
+        .change-positive { color: #22c55e; }
+        .change-negative { color: #ef4444; }
         
-        .confidence-bar {{
+        .confidence-bar {
             width: 60px;
             height: 6px;
             background: #334155;
             border-radius: 3px;
             overflow: hidden;
-        }}
+        }
         
-        .confidence-fill {{
+        .confidence-fill {
             height: 100%;
             border-radius: 3px;
             transition: width 0.3s;
-        }}
+        }
         
-        .range-cell {{
+        .range-cell {
             font-size: 13px;
             font-family: 'SF Mono', Monaco, monospace;
-        }}
+        }
         
-        .indicators-cell {{
+        .indicators-cell {
             font-size: 12px;
             color: #94a3b8;
-        }}
+        }
         
-        .indicator {{ margin-right: 12px; white-space: nowrap; }}
-        .indicator-label {{ color: #64748b; }}
+        .indicator { margin-right: 12px; white-space: nowrap; }
+        .indicator-label { color: #64748b; }
         
         /* Options Section Styles */
-        .options-section {{
+        .options-section {
             margin-top: 40px;
             padding-top: 30px;
             border-top: 1px solid #334155;
-        }}
+        }
         
-        .options-section h2 {{
+        .options-section h2 {
             margin-bottom: 10px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .options-subtitle {{
+        .options-subtitle {
             color: #94a3b8;
             margin-bottom: 20px;
             font-size: 14px;
-        }}
+        }
         
-        .options-grid {{
+        .options-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
             gap: 15px;
-        }}
+        }
         
-        .option-card {{
+        .option-card {
             background: #1e293b;
             border-radius: 12px;
             border: 1px solid #334155;
             padding: 20px;
             transition: border-color 0.2s, transform 0.2s;
-        }}
+        }
         
-        .option-card:hover {{
+        .option-card:hover {
             border-color: #3b82f6;
-        }}
+        }
         
-        .option-card.highlighted {{
+        .option-card.highlighted {
             border-color: #3b82f6;
             box-shadow: 0 0 20px rgba(59, 130, 246, 0.3);
             transform: scale(1.02);
-        }}
+        }
         
-        .option-header {{
+        .option-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 15px;
             padding-bottom: 15px;
             border-bottom: 1px solid #334155;
-        }}
+        }
         
-        .option-ticker {{
+        .option-ticker {
             font-size: 24px;
             font-weight: 700;
-        }}
+        }
         
-        .option-stock-price {{
+        .option-stock-price {
             font-size: 14px;
             color: #94a3b8;
             margin-top: 4px;
-        }}
+        }
         
-        .option-signal {{
+        .option-signal {
             text-align: right;
-        }}
+        }
         
-        .option-contract {{
+        .option-contract {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 15px;
-        }}
+        }
         
-        .option-field {{
+        .option-field {
             display: flex;
             flex-direction: column;
             gap: 4px;
-        }}
+        }
         
-        .option-field-label {{
+        .option-field-label {
             font-size: 11px;
             color: #64748b;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .option-field-value {{
+        .option-field-value {
             font-size: 16px;
             font-weight: 600;
             font-family: 'SF Mono', Monaco, monospace;
-        }}
+        }
         
-        .option-field-value.highlight {{
+        .option-field-value.highlight {
             color: #22c55e;
             font-size: 18px;
-        }}
+        }
         
-        .option-field-value.negative {{
+        .option-field-value.negative {
             color: #ef4444;
-        }}
+        }
         
-        .option-field-sub {{
+        .option-field-sub {
             font-size: 12px;
             color: #94a3b8;
-        }}
+        }
         
-        .option-buy-range {{
+        .option-buy-range {
             margin-top: 15px;
             padding-top: 15px;
             border-top: 1px solid #334155;
@@ -417,38 +425,38 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             margin: 15px -20px -20px -20px;
             padding: 15px 20px;
             border-radius: 0 0 12px 12px;
-        }}
+        }
         
-        .option-buy-range-label {{
+        .option-buy-range-label {
             font-size: 11px;
             color: #86efac;
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 5px;
-        }}
+        }
         
-        .option-buy-range-value {{
+        .option-buy-range-value {
             font-size: 18px;
             font-weight: 700;
             color: #86efac;
             font-family: 'SF Mono', Monaco, monospace;
-        }}
+        }
         
-        .no-options {{
+        .no-options {
             color: #64748b;
             font-style: italic;
             padding: 20px;
             text-align: center;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 30px;
             color: #64748b;
             font-size: 12px;
-        }}
+        }
         
-        .options-warning {{
+        .options-warning {
             padding: 15px 20px;
             background: #451a03;
             color: #fcd34d;
@@ -456,23 +464,25 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             text-align: center;
             border-radius: 8px;
             margin-top: 20px;
-        }}
-        
-        @media (max-width: 1200px) {{
-            .signals-table {{ display: block; overflow-x: auto; }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .market-banner {{ grid-template-columns: 1fr 1fr; }}
-            header {{ flex-direction: column; gap: 10px; text-align: center; }}
-            .options-grid {{ grid-template-columns: 1fr; }}
-            .option-contract {{ grid-template-columns: 1fr 1fr; }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .option-contract {{ grid-template-columns: 1fr; }}
-        }}
-    </style>
+        }
+        
+        @media (max-width: 1200px) {
+            .signals-table { display: block; overflow-x: auto; }
+        }
+        
+        @media (max-width: 768px) {
+            .market-banner { grid-template-columns: 1fr 1fr; }
+            header { flex-direction: column; gap: 10px; text-align: center; }
+            .options-grid { grid-template-columns: 1fr; }
+            .option-contract { grid-template-columns: 1fr 1fr; }
+        }
+        
+        @media (max-width: 480px) {
+            .option-contract { grid-template-columns: 1fr; }
+        }
+"""
+
+_HEADER = """    </style>
 </head>
 <body>
     <div class="container">
@@ -492,70 +502,83 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             </div>
         </header>
         
-        <script>
+"""
+
+_TIMESTAMP_JS = Template("""        <script>
             // Set the signals timestamp in Pacific time immediately
-            const signalsTime = '{results['generated_at']}';
-            document.getElementById('update-time').textContent = new Date(signalsTime).toLocaleString('en-US', {{
-                timeZone: 'America/Los_Angeles',
-                month: '2-digit',
-                day: '2-digit',
-                year: 'numeric',
-                hour: '2-digit',
-                minute: '2-digit',
-                hour12: true
-            }}) + ' PT';
+            let signalsTime = '${generated_at}';
+            function showSignalsTime() {
+                document.getElementById('update-time').textContent = new Date(signalsTime).toLocaleString('en-US', {
+                    timeZone: 'America/Los_Angeles',
+                    month: '2-digit',
+                    day: '2-digit',
+                    year: 'numeric',
+                    hour: '2-digit',
+                    minute: '2-digit',
+                    hour12: true
+                }) + ' PT';
+            }
+            showSignalsTime();
         </script>
         
-        <div class="market-banner">
-            <div class="market-card regime {regime['regime']}" id="regime-card">
+""")
+
+_MARKET_BANNER = Template("""        <div class="market-banner">
+            <div class="market-card regime ${regime}" id="regime-card">
                 <div class="market-label">Market Regime</div>
-                <div class="market-value" id="regime-value">{regime['regime']}</div>
-                <div class="market-change">Signal modifier: {regime['modifier']:.1f}x</div>
+                <div class="market-value" id="regime-value">${regime}</div>
+                <div class="market-change">Signal modifier: <span id="regime-modifier">${modifier}</span>x</div>
             </div>
             <div class="market-card">
                 <div class="market-label">S&P 500 (SPY)</div>
-                <div class="market-value">${regime['details']['spy_price']}</div>
-                <div class="market-change {'positive' if regime['details']['spy_vs_50ma'] >= 0 else 'negative'}">{regime['details']['spy_vs_50ma']:+.1f}% vs 50MA</div>
+                <div class="market-value" id="spy-price">$$${spy_price}</div>
+                <div class="market-change ${spy_change_class}" id="spy-vs-50ma">${spy_vs_50ma}% vs 50MA</div>
             </div>
             <div class="market-card">
                 <div class="market-label">NASDAQ 100 (QQQ)</div>
-                <div class="market-value">${regime['details']['qqq_price']}</div>
-                <div class="market-change {'positive' if regime['details']['qqq_vs_50ma'] >= 0 else 'negative'}">{regime['details']['qqq_vs_50ma']:+.1f}% vs 50MA</div>
+                <div class="market-value" id="qqq-price">$$${qqq_price}</div>
+                <div class="market-change ${qqq_change_class}" id="qqq-vs-50ma">${qqq_vs_50ma}% vs 50MA</div>
             </div>
             <div class="market-card">
                 <div class="market-label">Volatility (VIX)</div>
-                <div class="market-value">{regime['details']['vix']}</div>
-                <div class="market-change">{'Low' if regime['details']['vix'] < 15 else 'Normal' if regime['details']['vix'] < 25 else 'Elevated' if regime['details']['vix'] < 35 else 'Extreme'}</div>
+                <div class="market-value" id="vix-value">${vix}</div>
+                <div class="market-change" id="vix-label">${vix_label}</div>
             </div>
         </div>
         
-        <div class="summary-bar">
+""")
+
+_SUMMARY_BAR = Template("""        <div class="summary-bar">
             <div class="summary-group">
                 <span class="summary-label strong-buy">🟢🟢 STRONG BUY</span>
-                <span class="summary-tickers">{', '.join(results['summary']['strong_buy']) or '—'}</span>
+                <span class="summary-tickers" id="summary-strong-buy">${strong_buy}</span>
             </div>
             <div class="summary-group">
                 <span class="summary-label buy">🟢 BUY</span>
-                <span class="summary-tickers">{', '.join(results['summary']['buy']) or '—'}</span>
+                <span class="summary-tickers" id="summary-buy">${buy}</span>
             </div>
             <div class="summary-group">
                 <span class="summary-label sell">🔴 SELL</span>
-                <span class="summary-tickers">{', '.join(results['summary']['sell']) or '—'}</span>
+                <span class="summary-tickers" id="summary-sell">${sell}</span>
             </div>
             <div class="summary-group">
                 <span class="summary-label strong-sell">🔴🔴 STRONG SELL</span>
-                <span class="summary-tickers">{', '.join(results['summary']['strong_sell']) or '—'}</span>
+                <span class="summary-tickers" id="summary-strong-sell">${strong_sell}</span>
             </div>
         </div>
         
-        <div class="filters">
-            <button class="filter-btn active" onclick="filterSignals('all')">All ({len(signals)})</button>
-            <button class="filter-btn" onclick="filterSignals('actionable')">Actionable ({len([s for s in signals if s['signal'] != 'HOLD'])})</button>
+""")
+
+_FILTERS = Template("""        <div class="filters">
+            <button class="filter-btn active" onclick="filterSignals('all')">All (<span id="count-all">${n_all}</span>)</button>
+            <button class="filter-btn" onclick="filterSignals('actionable')">Actionable (<span id="count-actionable">${n_actionable}</span>)</button>
             <button class="filter-btn" onclick="filterSignals('buy')">Buy Signals</button>
             <button class="filter-btn" onclick="filterSignals('sell')">Sell Signals</button>
         </div>
         
-        <table class="signals-table">
+""")
+
+_SIGNALS_TABLE = """        <table class="signals-table">
             <thead>
                 <tr>
                     <th>Ticker</th>
@@ -569,7 +592,9 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
                 </tr>
             </thead>
             <tbody id="signals-body">
-            </tbody>
+"""
+
+_OPTIONS_SECTION = """            </tbody>
         </table>
         
         <div class="options-section" id="options-section">
@@ -589,36 +614,78 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
     </div>
     
     <script>
-        let signals = {signals_json};
-        const regime = {regime_json};
-        const summary = {summary_json};
-        const optionsData = {options_json};
+"""
+
+# One signal-table row; markup matches the rows built by renderSignals() in the page script
+_SIGNAL_ROW_HTML = """                <tr data-signal="{signal}" data-bucket="{bucket}">
+                    <td class="ticker-cell">
+                        <a class="ticker-link" onclick="scrollToOption('{ticker}')">{ticker}</a>
+                        <span class="sector-badge">{sector}</span>
+                    </td>
+                    <td>
+                        <span class="signal-badge {signal_class}">{signal}</span>
+                    </td>
+                    <td class="price-cell">${price_fmt}</td>
+                    <td class="{change_class}">{change_fmt}%</td>
+                    <td>
+                        <div style="display: flex; align-items: center; gap: 8px;">
+                            <div class="confidence-bar">
+                                <div class="confidence-fill" style="width: {confidence}%; background: {confidence_color};"></div>
+                            </div>
+                            <span>{confidence}%</span>
+                        </div>
+                    </td>
+                    <td class="range-cell">{buy_range}</td>
+                    <td class="range-cell">{sell_range}</td>
+                    <td class="indicators-cell">
+                        <span class="indicator"><span class="indicator-label">RSI:</span> {rsi_fmt}</span>
+                        <span class="indicator"><span class="indicator-label">Vol:</span> {volume_fmt}x</span>
+                        <span class="indicator"><span class="indicator-label">vs50MA:</span> {vs_sma50_fmt}%</span>
+                    </td>
+                </tr>
+"""
+
+_JS = """        // All page data in one blob; same shape as data.json.
+        // Signals are table columns (struct of arrays, one entry per row).
+        window.__DATA__ = __PAGE_DATA__;
+        let { signals: SIG, options: optionsData } = window.__DATA__;
+        let activeFilter = 'all';
+        // Option cards by ticker, rebuilt on each renderOptions()
+        const OPTION_CARDS = new Map();
         let lastPriceUpdate = null;
         
-        function getSignalClass(signal) {{
+        function getSignalClass(signal) {
             return signal.toLowerCase().replace(' ', '-');
-        }}
+        }
+        
+        function getSignalBuckets(signal) {
+            let buckets = 'all';
+            if (signal !== 'HOLD') buckets += ' actionable';
+            if (signal.includes('BUY')) buckets += ' buy';
+            if (signal.includes('SELL')) buckets += ' sell';
+            return buckets;
+        }
         
-        function getConfidenceColor(confidence) {{
+        function getConfidenceColor(confidence) {
             if (confidence >= 70) return '#22c55e';
             if (confidence >= 50) return '#eab308';
             return '#94a3b8';
-        }}
+        }
         
-        function scrollToOption(ticker) {{
-            const optionCard = document.getElementById('option-' + ticker);
-            if (optionCard) {{
-                document.querySelectorAll('.option-card').forEach(card => card.classList.remove('highlighted'));
+        function scrollToOption(ticker) {
+            const optionCard = OPTION_CARDS.get(ticker);
+            if (optionCard) {
+                OPTION_CARDS.forEach(card => card.classList.remove('highlighted'));
                 optionCard.classList.add('highlighted');
-                optionCard.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                setTimeout(() => {{
+                optionCard.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                setTimeout(() => {
                     optionCard.classList.remove('highlighted');
-                }}, 3000);
-            }}
-        }}
+                }, 3000);
+            }
+        }
         
-        function formatPacificTime(date) {{
-            return new Date(date).toLocaleString('en-US', {{
+        function formatPacificTime(date) {
+            return new Date(date).toLocaleString('en-US', {
                 timeZone: 'America/Los_Angeles',
                 year: 'numeric',
                 month: '2-digit',
@@ -627,11 +694,11 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
                 minute: '2-digit',
                 second: '2-digit',
                 hour12: true
-            }}) + ' PT';
-        }}
+            }) + ' PT';
+        }
         
-        async function fetchLivePrices() {{
-            const tickers = signals.map(s => s.ticker).join(',');
+        async function fetchLivePrices() {
+            const tickers = SIG.ticker.join(',');
             const btn = document.querySelector('.refresh-btn');
             const statusEl = document.getElementById('price-status');
             
@@ -639,113 +706,159 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
             btn.disabled = true;
             if (statusEl) statusEl.textContent = 'Fetching live prices...';
             
-            try {{
+            try {
                 // Use Yahoo Finance API via a CORS proxy
-                const response = await fetch(`https://query1.finance.yahoo.com/v7/finance/quote?symbols=${{tickers}}`, {{
+                const response = await fetch(`https://query1.finance.yahoo.com/v7/finance/quote?symbols=${tickers}`, {
                     mode: 'cors'
-                }}).catch(() => null);
+                }).catch(() => null);
                 
-                if (response && response.ok) {{
+                if (response && response.ok) {
                     const data = await response.json();
                     const quotes = data.quoteResponse?.result || [];
                     
                     // Update signals with live prices
-                    quotes.forEach(quote => {{
-                        const signal = signals.find(s => s.ticker === quote.symbol);
-                        if (signal && quote.regularMarketPrice) {{
-                            const oldPrice = signal.current_price;
-                            signal.current_price = quote.regularMarketPrice;
-                            signal.daily_change = quote.regularMarketChangePercent || signal.daily_change;
-                        }}
-                    }});
+                    quotes.forEach(quote => {
+                        const i = SIG.ticker.indexOf(quote.symbol);
+                        if (i >= 0 && quote.regularMarketPrice) {
+                            SIG.daily_change[i] = quote.regularMarketChangePercent || SIG.daily_change[i];
+                            SIG.price_fmt[i] = quote.regularMarketPrice.toFixed(2);
+                            SIG.change_fmt[i] = (SIG.daily_change[i] >= 0 ? '+' : '') + SIG.daily_change[i].toFixed(2);
+                        }
+                    });
                     
                     lastPriceUpdate = new Date();
-                    renderSignals(signals);
-                    if (statusEl) statusEl.textContent = `Prices updated: ${{formatPacificTime(lastPriceUpdate)}}`;
-                }} else {{
-                    // Fallback: just reload the page
-                    if (statusEl) statusEl.textContent = 'Live prices unavailable (CORS). Page reloaded.';
-                    setTimeout(() => location.reload(), 1000);
-                }}
-            }} catch (error) {{
+                    renderSignals();
+                    if (statusEl) statusEl.textContent = `Prices updated: ${formatPacificTime(lastPriceUpdate)}`;
+                } else {
+                    // Fallback: pick up the latest analysis instead
+                    if (statusEl) statusEl.textContent = 'Live prices unavailable (CORS). Showing latest signals.';
+                    refreshData();
+                }
+            } catch (error) {
                 console.log('Price fetch error:', error);
                 if (statusEl) statusEl.textContent = 'Could not fetch live prices. Data from last analysis.';
-            }}
+            }
             
             btn.classList.remove('loading');
             btn.disabled = false;
-        }}
-        
-        function refreshPage() {{
+        }
+        
+        // Pull the latest analysis from data.json without reloading the page
+        async function refreshData() {
+            try {
+                const response = await fetch('data.json', { cache: 'no-store' });
+                if (!response.ok) return;
+                const data = await response.json();
+                if (data.generated_at === signalsTime) return;
+                
+                window.__DATA__ = data;
+                signalsTime = data.generated_at;
+                SIG = data.signals;
+                optionsData = data.options;
+                showSignalsTime();
+                renderMarket(data.regime, data.summary);
+                renderSignals();
+                renderOptions();
+            } catch (error) {
+                console.log('Data refresh error:', error);
+            }
+        }
+        
+        // Update the server-rendered banner, summary and filter counts for a new analysis
+        function renderMarket(regime, summary) {
+            const details = regime.details;
+            const setText = (id, text) => { document.getElementById(id).textContent = text; };
+            const signed = value => (value >= 0 ? '+' : '') + value.toFixed(1);
+            const setChange = (id, value) => {
+                const el = document.getElementById(id);
+                el.textContent = `${signed(value)}% vs 50MA`;
+                el.classList.toggle('positive', value >= 0);
+                el.classList.toggle('negative', value < 0);
+            };
+            
+            document.getElementById('regime-card').className = `market-card regime ${regime.regime}`;
+            setText('regime-value', regime.regime);
+            setText('regime-modifier', regime.modifier.toFixed(1));
+            setText('spy-price', `$${details.spy_price}`);
+            setChange('spy-vs-50ma', details.spy_vs_50ma);
+            setText('qqq-price', `$${details.qqq_price}`);
+            setChange('qqq-vs-50ma', details.qqq_vs_50ma);
+            setText('vix-value', details.vix);
+            setText('vix-label', details.vix < 15 ? 'Low' : details.vix < 25 ? 'Normal' : details.vix < 35 ? 'Elevated' : 'Extreme');
+            
+            ['strong_buy', 'buy', 'sell', 'strong_sell'].forEach(key => {
+                setText(`summary-${key.replace('_', '-')}`, summary[key].join(', ') || '—');
+            });
+            setText('count-all', SIG.signal.length);
+            setText('count-actionable', SIG.signal.filter(signal => signal !== 'HOLD').length);
+        }
+        
+        function refreshPage() {
             fetchLivePrices();
-        }}
+        }
         
-        // Auto-refresh prices every 5 minutes
+        // Auto-refresh signals and prices every 5 minutes
+        setInterval(refreshData, 5 * 60 * 1000);
         setInterval(fetchLivePrices, 5 * 60 * 1000);
         
-        function renderSignals(filteredSignals) {{
-            const tbody = document.getElementById('signals-body');
-            tbody.innerHTML = '';
+        function renderSignals() {
+            // Build every row as a string and hand the browser a single innerHTML parse
+            const parts = [];
             
-            filteredSignals.forEach(signal => {{
-                const changeClass = signal.daily_change >= 0 ? 'change-positive' : 'change-negative';
-                const changeSign = signal.daily_change >= 0 ? '+' : '';
+            for (let i = 0; i < SIG.ticker.length; i++) {
+                const changeClass = SIG.daily_change[i] >= 0 ? 'change-positive' : 'change-negative';
                 
-                const row = document.createElement('tr');
-                row.dataset.signal = signal.signal;
-                row.innerHTML = `
+                parts.push(`<tr data-signal="${SIG.signal[i]}" data-bucket="${getSignalBuckets(SIG.signal[i])}">
                     <td class="ticker-cell">
-                        <a class="ticker-link" onclick="scrollToOption('${{signal.ticker}}')">${{signal.ticker}}</a>
-                        <span class="sector-badge">${{signal.sector}}</span>
+                        <a class="ticker-link" onclick="scrollToOption('${SIG.ticker[i]}')">${SIG.ticker[i]}</a>
+                        <span class="sector-badge">${SIG.sector[i]}</span>
                     </td>
                     <td>
-                        <span class="signal-badge ${{getSignalClass(signal.signal)}}">${{signal.signal}}</span>
+                        <span class="signal-badge ${getSignalClass(SIG.signal[i])}">${SIG.signal[i]}</span>
                     </td>
-                    <td class="price-cell">$${{signal.current_price.toFixed(2)}}</td>
-                    <td class="${{changeClass}}">${{changeSign}}${{signal.daily_change.toFixed(2)}}%</td>
+                    <td class="price-cell">$${SIG.price_fmt[i]}</td>
+                    <td class="${changeClass}">${SIG.change_fmt[i]}%</td>
                     <td>
                         <div style="display: flex; align-items: center; gap: 8px;">
                             <div class="confidence-bar">
-                                <div class="confidence-fill" style="width: ${{signal.confidence}}%; background: ${{getConfidenceColor(signal.confidence)}};"></div>
+                                <div class="confidence-fill" style="width: ${SIG.confidence[i]}%; background: ${getConfidenceColor(SIG.confidence[i])};"></div>
                             </div>
-                            <span>${{signal.confidence}}%</span>
+                            <span>${SIG.confidence[i]}%</span>
                         </div>
                     </td>
-                    <td class="range-cell">${{signal.buy_range}}</td>
-                    <td class="range-cell">${{signal.sell_range}}</td>
+                    <td class="range-cell">${SIG.buy_range[i]}</td>
+                    <td class="range-cell">${SIG.sell_range[i]}</td>
                     <td class="indicators-cell">
-                        <span class="indicator"><span class="indicator-label">RSI:</span> ${{signal.indicators.rsi.toFixed(0)}}</span>
-                        <span class="indicator"><span class="indicator-label">Vol:</span> ${{signal.indicators.volume_ratio.toFixed(1)}}x</span>
-                        <span class="indicator"><span class="indicator-label">vs50MA:</span> ${{signal.indicators.vs_sma50 >= 0 ? '+' : ''}}${{signal.indicators.vs_sma50.toFixed(1)}}%</span>
+                        <span class="indicator"><span class="indicator-label">RSI:</span> ${SIG.rsi_fmt[i]}</span>
+                        <span class="indicator"><span class="indicator-label">Vol:</span> ${SIG.volume_fmt[i]}x</span>
+                        <span class="indicator"><span class="indicator-label">vs50MA:</span> ${SIG.vs_sma50_fmt[i]}%</span>
                     </td>
-                `;
-                tbody.appendChild(row);
-            }});
-        }}
+                </tr>`);
+            }
+            
+            document.getElementById('signals-body').innerHTML = parts.join('');
+            applyFilter();
+        }
         
-        function renderOptions() {{
+        function renderOptions() {
             const grid = document.getElementById('options-grid');
-            grid.innerHTML = '';
+            OPTION_CARDS.clear();
             
-            if (!optionsData || optionsData.length === 0) {{
+            if (!optionsData || optionsData.length === 0) {
                 grid.innerHTML = '<p class="no-options">No options data available. Run with options analysis enabled.</p>';
                 return;
-            }}
+            }
             
-            // Sort by return potential
-            const sortedOptions = [...optionsData].filter(s => s.options && s.options.length > 0)
-                .sort((a, b) => {{
-                    const returnA = a.options[0]?.return_at_target || 0;
-                    const returnB = b.options[0]?.return_at_target || 0;
-                    return returnB - returnA;
-                }});
+            // Already sorted by return potential in Python
+            const sortedOptions = optionsData.filter(s => s.options && s.options.length > 0);
             
-            if (sortedOptions.length === 0) {{
+            if (sortedOptions.length === 0) {
                 grid.innerHTML = '<p class="no-options">No suitable LEAPS options found for any stocks.</p>';
                 return;
-            }}
+            }
             
-            sortedOptions.forEach(stock => {{
+            const parts = [];
+            sortedOptions.forEach(stock => {
                 const opt = stock.options[0];
                 const returnClass = opt.return_at_target >= 0 ? 'highlight' : 'negative';
                 
@@ -753,107 +866,400 @@ def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', optio
                 const buyLow = opt.bid > 0 ? opt.bid.toFixed(2) : (opt.mid_price * 0.95).toFixed(2);
                 const buyHigh = opt.mid_price.toFixed(2);
                 
-                const card = document.createElement('div');
-                card.className = 'option-card';
-                card.id = 'option-' + stock.ticker;
-                
-                card.innerHTML = `
+                parts.push(`<div class="option-card" id="option-${stock.ticker}">
                     <div class="option-header">
                         <div>
-                            <div class="option-ticker">${{stock.ticker}}</div>
-                            <div class="option-stock-price">Stock: $${{stock.current_price.toFixed(2)}} → Target: $${{stock.target_price?.toFixed(2) || opt.target_price.toFixed(2)}}</div>
+                            <div class="option-ticker">${stock.ticker}</div>
+                            <div class="option-stock-price">Stock: $${stock.current_price.toFixed(2)} → Target: $${stock.target_price?.toFixed(2) || opt.target_price.toFixed(2)}</div>
                         </div>
                         <div class="option-signal">
-                            <span class="signal-badge ${{getSignalClass(stock.signal)}}">${{stock.signal}}</span>
+                            <span class="signal-badge ${getSignalClass(stock.signal)}">${stock.signal}</span>
                         </div>
                     </div>
                     
                     <div class="option-contract">
                         <div class="option-field">
                             <span class="option-field-label">Strike Price</span>
-                            <span class="option-field-value">$${{opt.strike.toFixed(2)}}</span>
-                            <span class="option-field-sub">${{opt.moneyness_label}} (${{opt.moneyness > 0 ? '+' : ''}}${{opt.moneyness.toFixed(1)}}%)</span>
+                            <span class="option-field-value">$${opt.strike.toFixed(2)}</span>
+                            <span class="option-field-sub">${opt.moneyness_label} (${opt.moneyness > 0 ? '+' : ''}${opt.moneyness.toFixed(1)}%)</span>
                         </div>
                         <div class="option-field">
                             <span class="option-field-label">Expiry</span>
-                            <span class="option-field-value">${{opt.expiry}}</span>
-                            <span class="option-field-sub">${{opt.days_to_expiry}} days</span>
+                            <span class="option-field-value">${opt.expiry}</span>
+                            <span class="option-field-sub">${opt.days_to_expiry} days</span>
                         </div>
                         <div class="option-field">
                             <span class="option-field-label">Potential Return</span>
-                            <span class="option-field-value ${{returnClass}}">${{opt.return_at_target >= 0 ? '+' : ''}}${{opt.return_at_target.toFixed(0)}}%</span>
+                            <span class="option-field-value ${returnClass}">${opt.return_at_target >= 0 ? '+' : ''}${opt.return_at_target.toFixed(0)}%</span>
                             <span class="option-field-sub">at target price</span>
                         </div>
                         <div class="option-field">
                             <span class="option-field-label">Leverage</span>
-                            <span class="option-field-value">${{opt.leverage.toFixed(1)}}x</span>
-                            <span class="option-field-sub">IV: ${{opt.implied_volatility.toFixed(0)}}%</span>
+                            <span class="option-field-value">${opt.leverage.toFixed(1)}x</span>
+                            <span class="option-field-sub">IV: ${opt.implied_volatility.toFixed(0)}%</span>
                         </div>
                     </div>
                     
                     <div class="option-buy-range">
                         <div class="option-buy-range-label">💰 Recommended Buy Range</div>
-                        <div class="option-buy-range-value">$${{buyLow}} - $${{buyHigh}} per share</div>
+                        <div class="option-buy-range-value">$${buyLow} - $${buyHigh} per share</div>
                     </div>
-                `;
-                
-                grid.appendChild(card);
-            }});
+                </div>`);
+            });
             
             // Add cards for stocks without options
             const noOptionsStocks = optionsData.filter(s => !s.options || s.options.length === 0);
-            if (noOptionsStocks.length > 0) {{
-                const noOptDiv = document.createElement('div');
-                noOptDiv.className = 'option-card';
-                noOptDiv.style.gridColumn = '1 / -1';
-                noOptDiv.innerHTML = `
-                    <p class="no-options">No LEAPS available for: ${{noOptionsStocks.map(s => s.ticker).join(', ')}}</p>
-                `;
-                grid.appendChild(noOptDiv);
-            }}
-        }}
-        
-        function filterSignals(filter) {{
+            if (noOptionsStocks.length > 0) {
+                parts.push(`<div class="option-card" style="grid-column: 1 / -1;">
+                    <p class="no-options">No LEAPS available for: ${noOptionsStocks.map(s => s.ticker).join(', ')}</p>
+                </div>`);
+            }
+            
+            grid.innerHTML = parts.join('');
+            grid.querySelectorAll('.option-card[id]').forEach(card => OPTION_CARDS.set(card.id.slice('option-'.length), card));
+        }
+        
+        function filterSignals(filter) {
             // Update button states
             document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
             event.target.classList.add('active');
             
-            let filtered;
-            switch(filter) {{
-                case 'actionable':
-                    filtered = signals.filter(s => s.signal !== 'HOLD');
-                    break;
-                case 'buy':
-                    filtered = signals.filter(s => s.signal.includes('BUY'));
-                    break;
-                case 'sell':
-                    filtered = signals.filter(s => s.signal.includes('SELL'));
-                    break;
-                default:
-                    filtered = signals;
-            }}
-            
-            renderSignals(filtered);
-        }}
-        
-        // Initial render
-        renderSignals(signals);
+            activeFilter = filter;
+            applyFilter();
+        }
+        
+        function applyFilter() {
+            // Rows carry their bucket memberships, so filtering only toggles visibility
+            document.querySelectorAll('#signals-body tr').forEach(row => {
+                row.style.display = row.dataset.bucket.split(' ').includes(activeFilter) ? '' : 'none';
+            });
+        }
+        
+        // Initial render (signal rows are pre-rendered into the page)
         renderOptions();
         
         // Fetch live prices on page load
         setTimeout(fetchLivePrices, 1000);
         
         // Check for hash in URL to auto-scroll to option
-        if (window.location.hash) {{
+        if (window.location.hash) {
             const ticker = window.location.hash.substring(1);
             setTimeout(() => scrollToOption(ticker), 500);
-        }}
-    </script>
+        }
+"""
+
+_PAGE_END = """    </script>
 </body>
 </html>"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    if rcssmin is not None:
+        return rcssmin.cssmin(css)
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop comment lines and indentation from a script, leaving template literals intact."""
+    if rjsmin is not None:
+        return rjsmin.jsmin(js)
+    lines = []
+    in_template = False
+    for line in js.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('//'):
+                lines.append(stripped)
+        if line.count('`') % 2:
+            in_template = not in_template
+    return '\n'.join(lines) + '\n'
+
+
+# Minified once at import; edit the readable sources above
+_CSS = _minify_css(_CSS)
+_JS = _minify_js(_JS)
+
+# Static fragments pre-encoded for the byte-level page writer
+_HEAD_BYTES = (_HEAD + _CSS + _HEADER).encode('utf-8')
+_SIGNALS_TABLE_BYTES = _SIGNALS_TABLE.encode('utf-8')
+_SCRIPT_OPEN_BYTES, _SCRIPT_CLOSE_BYTES = (_OPTIONS_SECTION + _JS + _PAGE_END).encode('utf-8').split(b'__PAGE_DATA__')
+
+
+def _to_fixed(value: float, digits: int) -> str:
+    """Format a number like JavaScript's toFixed (ties round away from zero)."""
+    if value == 0:
+        value = 0.0
+    return str(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+
+def _signal_buckets(signal: str) -> str:
+    """Space-separated filter buckets a signal belongs to."""
+    buckets = 'all'
+    if signal != 'HOLD':
+        buckets += ' actionable'
+    if 'BUY' in signal:
+        buckets += ' buy'
+    if 'SELL' in signal:
+        buckets += ' sell'
+    return buckets
+
+
+def _confidence_color(confidence: float) -> str:
+    """Bar colour for a confidence percentage."""
+    if confidence >= 70:
+        return '#22c55e'
+    if confidence >= 50:
+        return '#eab308'
+    return '#94a3b8'
+
+
+def _with_display_strings(signal: Dict) -> Dict:
+    """Copy of a signal with its table values pre-formatted for display."""
+    indicators = signal['indicators']
+    return {
+        **signal,
+        'price_fmt': _to_fixed(signal['current_price'], 2),
+        'change_fmt': ('+' if signal['daily_change'] >= 0 else '') + _to_fixed(signal['daily_change'], 2),
+        'rsi_fmt': _to_fixed(indicators['rsi'], 0),
+        'volume_fmt': _to_fixed(indicators['volume_ratio'], 1),
+        'vs_sma50_fmt': ('+' if indicators['vs_sma50'] >= 0 else '') + _to_fixed(indicators['vs_sma50'], 1)
+    }
+
+
+# Python expression for each _SIGNAL_ROW_HTML field, in terms of a formatted signal `s`
+_ROW_FIELD_EXPRS = {
+    'ticker': "s['ticker']",
+    'sector': "s['sector']",
+    'signal': "s['signal']",
+    'signal_class': "s['signal'].lower().replace(' ', '-', 1)",
+    'bucket': "_signal_buckets(s['signal'])",
+    'price_fmt': "s['price_fmt']",
+    'change_class': "('change-positive' if s['daily_change'] >= 0 else 'change-negative')",
+    'change_fmt': "s['change_fmt']",
+    'confidence': "str(s['confidence'])",
+    'confidence_color': "_confidence_color(s['confidence'])",
+    'buy_range': "s['buy_range']",
+    'sell_range': "s['sell_range']",
+    'rsi_fmt': "s['rsi_fmt']",
+    'volume_fmt': "s['volume_fmt']",
+    'vs_sma50_fmt': "s['vs_sma50_fmt']"
+}
+
+
+def _compile_row_renderer(template: str, exprs: Dict[str, str]) -> Callable[[Dict], str]:
+    """Specialize a str.format template into a function of one signal.
+    
+    Literal chunks become constants and each field is inlined as its
+    expression, so rendering a row is a single join with no intermediate
+    field dict or format-string parsing.
+    """
+    pieces = []
+    for literal, field, _, _ in Formatter().parse(template):
+        if literal:
+            pieces.append(repr(literal))
+        if field is not None:
+            pieces.append(exprs[field])
+    source = f"def _render_row(s):\n    return ''.join(({', '.join(pieces)},))\n"
+    namespace = {'_signal_buckets': _signal_buckets, '_confidence_color': _confidence_color}
+    exec(compile(source, '<dashboard row>', 'exec'), namespace)
+    return namespace['_render_row']
+
+
+_render_signal_row = _compile_row_renderer(_SIGNAL_ROW_HTML, _ROW_FIELD_EXPRS)
+
+
+def _iter_signal_rows(signals: List[Dict]) -> Iterator[str]:
+    """Yield the table row HTML for each signal, one at a time."""
+    for signal in signals:
+        yield _render_signal_row(signal)
+
+
+# Signal fields used by the page script, emitted column-wise
+_SIGNAL_COLUMNS = ('ticker', 'signal', 'sector', 'daily_change', 'price_fmt', 'change_fmt', 'confidence',
+                   'buy_range', 'sell_range', 'rsi_fmt', 'volume_fmt', 'vs_sma50_fmt')
+
+
+def _signal_columns(signals: List[Dict]) -> Dict[str, list]:
+    """Struct-of-arrays view of the signals, so keys are not repeated per row."""
+    return {k: [s[k] for s in signals] for k in _SIGNAL_COLUMNS}
+
+
+# Reused stdlib encoder for when orjson is unavailable (json.dumps with
+# non-default options builds a new encoder on every call)
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+
+
+def json_safe(obj):
+    """Copy of obj for the stdlib json module, matching what orjson writes.
+    
+    numpy scalars and arrays become native Python values, and NaN/Infinity
+    floats become None.
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        obj = obj.tolist()
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [json_safe(v) for v in obj]
+    return obj
+
+
+def _to_json(obj) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed.
+    
+    Non-finite floats become null on both paths, so the output is always valid JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return _JSON_ENCODER.encode(json_safe(obj)).encode('utf-8')
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write bytes to a temp file with raw os.write calls, then swap it into place."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Input digest of the last dashboard written per output path
+_LAST_DIGEST: Dict[str, str] = {}
+
+
+def _input_digest(results: Dict, options_data: list) -> str:
+    """Stable digest of the dashboard inputs and page template."""
+    h = hashlib.blake2b(digest_size=16)
+    for fragment in (_HEAD, _CSS, _HEADER, _TIMESTAMP_JS.template, _MARKET_BANNER.template,
+                     _SUMMARY_BAR.template, _FILTERS.template, _SIGNALS_TABLE, _OPTIONS_SECTION,
+                     _SIGNAL_ROW_HTML, _JS, _PAGE_END):
+        h.update(fragment.encode('utf-8'))
+    inputs = [
+        results['generated_at'],
+        results['market_regime'],
+        results['summary'],
+        results['signals'],
+        options_data
+    ]
+    if orjson is not None:
+        h.update(orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str))
+    else:
+        h.update(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8'))
+    return h.hexdigest()
+
+
+def generate_dashboard(results: Dict, output_path: str = 'dashboard.html', options_data: list = None) -> str:
+    """Generate a static HTML dashboard with all signal data.
+    
+    Also writes the page data to a 'data.json' next to the page, which the
+    open page polls to refresh itself in place. Skips the rebuild when this
+    process already wrote the same inputs, run timestamps included, to the
+    same path.
+    """
+    
+    digest = _input_digest(results, options_data)
+    data_path = os.path.join(os.path.dirname(output_path), 'data.json')
+    if (_LAST_DIGEST.get(output_path) == digest
+            and os.path.exists(output_path) and os.path.exists(data_path)):
+        print(f"✅ Dashboard unchanged: {output_path}")
+        return output_path
+    
+    regime = results['market_regime']
+    details = regime['details']
+    summary = results['summary']
+    
+    # Sort signals by composite score and pre-format their display values once,
+    # for both the server-rendered rows and the page script
+    sorted_signals = [_with_display_strings(s) for s in
+                      sorted(results['signals'], key=itemgetter('composite_score'), reverse=True)]
+    n_all = len(sorted_signals)
+    n_actionable = 0
+    for s in sorted_signals:
+        n_actionable += s['signal'] != 'HOLD'
+    
+    # Order options by potential return (stocks without options keep their order at the end)
+    options_data = options_data or []
+    with_options = [s for s in options_data if s.get('options')]
+    with_options.sort(key=lambda s: s['options'][0].get('return_at_target') or 0, reverse=True)
+    options_data = with_options + [s for s in options_data if not s.get('options')]
+    
+    vix = details['vix']
+    if vix < 15:
+        vix_label = 'Low'
+    elif vix < 25:
+        vix_label = 'Normal'
+    elif vix < 35:
+        vix_label = 'Elevated'
+    else:
+        vix_label = 'Extreme'
+    
+    # Convert to JSON for JavaScript, as a single blob
+    data_json = _to_json({
+        'generated_at': results['generated_at'],
+        'signals': _signal_columns(sorted_signals),
+        'regime': regime,
+        'summary': summary,
+        'options': options_data
+    })
+    
+    dynamic = ''.join((
+        _TIMESTAMP_JS.substitute(generated_at=results['generated_at']),
+        _MARKET_BANNER.substitute(
+            regime=regime['regime'],
+            modifier=f"{regime['modifier']:.1f}",
+            spy_price=details['spy_price'],
+            spy_vs_50ma=f"{details['spy_vs_50ma']:+.1f}",
+            spy_change_class='positive' if details['spy_vs_50ma'] >= 0 else 'negative',
+            qqq_price=details['qqq_price'],
+            qqq_vs_50ma=f"{details['qqq_vs_50ma']:+.1f}",
+            qqq_change_class='positive' if details['qqq_vs_50ma'] >= 0 else 'negative',
+            vix=vix,
+            vix_label=vix_label
+        ),
+        _SUMMARY_BAR.substitute(
+            strong_buy=', '.join(summary['strong_buy']) or '—',
+            buy=', '.join(summary['buy']) or '—',
+            sell=', '.join(summary['sell']) or '—',
+            strong_sell=', '.join(summary['strong_sell']) or '—'
+        ),
+        _FILTERS.substitute(
+            n_all=n_all,
+            n_actionable=n_actionable
+        )
+    ))
+    
+    # Assemble the page as bytes around the pre-encoded static fragments
+    page = b''.join((
+        _HEAD_BYTES,
+        dynamic.encode('utf-8'),
+        _SIGNALS_TABLE_BYTES,
+        ''.join(_iter_signal_rows(sorted_signals)).encode('utf-8'),
+        _SCRIPT_OPEN_BYTES,
+        data_json,
+        _SCRIPT_CLOSE_BYTES
+    ))
+    _write_atomic(output_path, page)
+    
+    # Same data as a standalone file for in-place refreshes of an open page
+    _write_atomic(data_path, data_json)
+    
+    # Pre-compressed copy so a static server can send it with Content-Encoding: gzip
+    _write_atomic(output_path + '.gz', gzip.compress(page, compresslevel=6))
     
-    with open(output_path, 'w') as f:
-        f.write(html)
+    _LAST_DIGEST[output_path] = digest
     
     print(f"✅ Dashboard generated: {output_path}")
     return output_path
@@ -8,181 +8,230 @@ Recommends optimal strike, expiry, and price targets.
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import pytz
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import pickle
+import threading
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernels run as plain numpy array code
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# On-disk cache for yfinance options responses
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'options')
+MARKET_HOURS_TTL = 15 * 60        # Quotes move during the session
+OFF_HOURS_TTL = 24 * 60 * 60      # Chains are static outside market hours
+
+# Cap on Yahoo requests in flight across all tickers and expiries
+MAX_CONCURRENT_REQUESTS = 16
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _cache_ttl() -> int:
+    """Seconds a cached options response stays fresh right now."""
+    now = datetime.now(pytz.timezone('America/New_York'))
+    if now.weekday() < 5 and (9, 30) <= (now.hour, now.minute) < (16, 0):
+        return MARKET_HOURS_TTL
+    return OFF_HOURS_TTL
+
+
+def _disk_cached(fetch):
+    """Cache an OptionsAnalyzer fetch on disk, keyed by ticker and arguments.
+    
+    Only successful fetches are stored; exceptions propagate uncached.
+    """
+    @wraps(fetch)
+    def wrapper(self, *args):
+        if not self.use_cache:
+            return fetch(self, *args)
+        
+        key = hashlib.md5('|'.join([self.ticker, fetch.__name__, *map(str, args)]).encode()).hexdigest()
+        path = os.path.join(CACHE_DIR, self.ticker, f'{key}.pkl')
+        
+        try:
+            with open(path, 'rb') as f:
+                saved_at, value = pickle.load(f)
+            if time.time() - saved_at < _cache_ttl():
+                return value
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            pass
+        
+        value = fetch(self, *args)
+        
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not cache options data for {self.ticker}: {e}")
+        
+        return value
+    return wrapper
+
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def _metrics_kernel(strike: np.ndarray, mid_price: np.ndarray, current_price: float, target_price: float,
+                    days_to_expiry: int, is_call: bool) -> Tuple[np.ndarray, ...]:
+    """Price-derived option metrics for a whole chain, as parallel arrays."""
+    sign = 1.0 if is_call else -1.0
+    
+    # Intrinsic and extrinsic value
+    intrinsic = np.maximum(0.0, sign * (current_price - strike))
+    value_at_target = np.maximum(0.0, sign * (target_price - strike))
+    extrinsic = mid_price - intrinsic
+    
+    return_at_target = (value_at_target - mid_price) / mid_price * 100
+    break_even = strike + sign * mid_price
+    moneyness = sign * (current_price - strike) / current_price * 100
+    
+    # Rough delta estimate by moneyness: 0.2 deep OTM, 0.45 / 0.55 near the money, 0.8 deep ITM
+    delta = sign * (0.2 + 0.25 * (moneyness > -10) + 0.1 * (moneyness > 0) + 0.25 * (moneyness > 10))
+    
+    # Leverage ratio (how much option moves vs stock)
+    leverage = np.abs(delta) * current_price / mid_price
+    
+    # Theta decay (rough estimate - higher for OTM, shorter expiry)
+    if days_to_expiry > 0:
+        daily_theta_pct = extrinsic / days_to_expiry / mid_price * 100
+    else:
+        daily_theta_pct = np.zeros_like(mid_price)
+    
+    return intrinsic, extrinsic, return_at_target, break_even, moneyness, delta, leverage, daily_theta_pct
+
 
 class OptionsAnalyzer:
     """Analyzes options chains and recommends optimal LEAPS."""
     
-    def __init__(self, ticker: str, current_price: float, signal: str, sell_target: float, buy_target: float):
+    __slots__ = ('ticker', 'current_price', 'signal', 'sell_target', 'buy_target', 'use_cache', 'stock')
+    
+    # Strike window considered, as a fraction of the current price
+    MIN_STRIKE_RATIO = 0.5
+    MAX_STRIKE_RATIO = 1.5
+    
+    # Columns of a yfinance chain read by calculate_option_metrics
+    CHAIN_COLUMNS = ['strike', 'bid', 'ask', 'lastPrice', 'impliedVolatility', 'volume', 'openInterest']
+    
+    # Decimal places of the metrics in a recommendation
+    METRIC_DECIMALS = {
+        'bid': 2, 'ask': 2, 'mid_price': 2, 'last_price': 2, 'implied_volatility': 1, 'delta': 2,
+        'intrinsic': 2, 'extrinsic': 2, 'moneyness': 1, 'break_even': 2,
+        'return_at_target': 1, 'leverage': 1, 'daily_theta_pct': 3, 'liquidity_score': 1,
+        'risk_reward': 2
+    }
+    
+    def __init__(self, ticker: str, current_price: float, signal: str, sell_target: float, buy_target: float,
+                 use_cache: bool = True):
         self.ticker = ticker
         self.current_price = current_price
         self.signal = signal
         self.sell_target = sell_target  # Upper price target
         self.buy_target = buy_target    # Lower price target (for entry)
+        self.use_cache = use_cache
         self.stock = yf.Ticker(ticker)
+    
+    @_disk_cached
+    def _fetch_expiries(self) -> Tuple[str, ...]:
+        with _request_slots:
+            return tuple(self.stock.options)
+    
+    @_disk_cached
+    def _fetch_chain(self, expiry: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        with _request_slots:
+            chain = self.stock.option_chain(expiry)
+        return chain.calls, chain.puts
         
-    def get_leaps_expiries(self, min_days: int = 180, max_days: int = 1100) -> List[str]:
-        """Get expiration dates for LEAPS (6 months to 3 years out)."""
+    def get_leaps_expiries(self, min_days: int = 180, max_days: int = 1100) -> Dict[str, int]:
+        """Get expiration dates for LEAPS (6 months to 3 years out), mapped to days to expiry."""
         try:
-            all_expiries = self.stock.options
-            leaps = []
-            today = datetime.now()
-            
-            for exp in all_expiries:
-                exp_date = datetime.strptime(exp, '%Y-%m-%d')
-                days_to_exp = (exp_date - today).days
-                
-                if min_days <= days_to_exp <= max_days:
-                    leaps.append(exp)
+            all_expiries = self._fetch_expiries()
+            exp_dates = pd.to_datetime(pd.Index(all_expiries), format='%Y-%m-%d')
+            days_to_exp = (exp_dates - pd.Timestamp.now()).days.to_numpy()
             
-            return leaps
+            in_range = (days_to_exp >= min_days) & (days_to_exp <= max_days)
+            return dict(zip(np.asarray(all_expiries, dtype=object)[in_range], days_to_exp[in_range].tolist()))
         except Exception as e:
             print(f"Error getting expiries for {self.ticker}: {e}")
-            return []
+            return {}
     
     def get_options_chain(self, expiry: str) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
         """Get calls and puts for a specific expiry."""
         try:
-            chain = self.stock.option_chain(expiry)
-            return chain.calls, chain.puts
+            return self._fetch_chain(expiry)
         except Exception as e:
             print(f"Error getting chain for {self.ticker} {expiry}: {e}")
             return None, None
     
-    def calculate_option_metrics(self, option_row: pd.Series, is_call: bool, target_price: float, days_to_expiry: int) -> Dict:
-        """Calculate key metrics for an option."""
-        
-        strike = option_row['strike']
-        bid = option_row.get('bid', 0) or 0
-        ask = option_row.get('ask', 0) or 0
-        last_price = option_row.get('lastPrice', 0) or 0
-        implied_vol = option_row.get('impliedVolatility', 0) or 0
-        
-        # Handle NaN values for volume and open interest
-        volume = option_row.get('volume', 0)
-        open_interest = option_row.get('openInterest', 0)
-        
-        # Convert NaN to 0
-        if pd.isna(volume):
-            volume = 0
-        if pd.isna(open_interest):
-            open_interest = 0
-        if pd.isna(bid):
-            bid = 0
-        if pd.isna(ask):
-            ask = 0
-        if pd.isna(last_price):
-            last_price = 0
-        if pd.isna(implied_vol):
-            implied_vol = 0
-        
-        volume = int(volume)
-        open_interest = int(open_interest)
-        
-        # Use mid price if available, otherwise last price
-        if bid > 0 and ask > 0:
-            mid_price = (bid + ask) / 2
-        else:
-            mid_price = last_price
-        
-        if mid_price <= 0:
-            return None
+    def calculate_option_metrics(self, options: pd.DataFrame, is_call: bool, target_price: float, days_to_expiry: int) -> pd.DataFrame:
+        """Calculate key metrics for every option in a chain at once.
         
-        # Calculate intrinsic and extrinsic value
-        if is_call:
-            intrinsic = max(0, self.current_price - strike)
-            value_at_target = max(0, target_price - strike)
-        else:
-            intrinsic = max(0, strike - self.current_price)
-            value_at_target = max(0, strike - target_price)
+        Returns one unrounded row per option (see METRIC_DECIMALS for display);
+        options without a usable price are dropped.
+        """
         
-        extrinsic = mid_price - intrinsic
+        # Missing columns and NaN values count as 0
+        chain = options.reindex(columns=self.CHAIN_COLUMNS).fillna(0).to_numpy(dtype=float)
         
-        # Calculate returns
-        if mid_price > 0:
-            return_at_target = ((value_at_target - mid_price) / mid_price) * 100
-            max_loss = -100  # Can lose entire premium
-        else:
-            return_at_target = 0
-            max_loss = 0
+        # Drop options with no usable price (no two-sided quote and no last trade) up front
+        bid, ask, last_price = chain[:, 1], chain[:, 2], chain[:, 3]
+        chain = chain[((bid > 0) & (ask > 0)) | (last_price > 0)]
+        strike, bid, ask, last_price, implied_vol, volume, open_interest = chain.T
+        volume = volume.astype(int)
+        open_interest = open_interest.astype(int)
         
-        # Break-even price
-        if is_call:
-            break_even = strike + mid_price
-        else:
-            break_even = strike - mid_price
-        
-        # Moneyness
-        if is_call:
-            moneyness = (self.current_price - strike) / self.current_price * 100
-        else:
-            moneyness = (strike - self.current_price) / self.current_price * 100
-        
-        # Leverage (delta approximation for ATM)
-        delta = option_row.get('delta', None)
-        if delta is None:
-            # Rough delta estimate
-            if is_call:
-                if moneyness > 10:
-                    delta = 0.8
-                elif moneyness > 0:
-                    delta = 0.55
-                elif moneyness > -10:
-                    delta = 0.45
-                else:
-                    delta = 0.2
-            else:
-                if moneyness > 10:
-                    delta = -0.8
-                elif moneyness > 0:
-                    delta = -0.55
-                elif moneyness > -10:
-                    delta = -0.45
-                else:
-                    delta = -0.2
-        
-        # Leverage ratio (how much option moves vs stock)
-        leverage = (abs(delta) * self.current_price) / mid_price if mid_price > 0 else 0
+        # Use mid price if available, otherwise last price
+        mid_price = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last_price)
         
-        # Theta decay (rough estimate - higher for OTM, shorter expiry)
-        daily_theta_pct = (extrinsic / days_to_expiry / mid_price * 100) if days_to_expiry > 0 and mid_price > 0 else 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            (intrinsic, extrinsic, return_at_target, break_even,
+             moneyness, delta, leverage, daily_theta_pct) = _metrics_kernel(
+                strike, mid_price, float(self.current_price), float(target_price), int(days_to_expiry), is_call)
         
         # Liquidity score (0-100)
-        liquidity_score = min(100, (volume or 0) / 10 + (open_interest or 0) / 100)
+        liquidity_score = np.clip(volume / 10 + open_interest / 100, 0, 100)
         
-        # Risk/Reward score (higher is better)
-        if return_at_target > 0:
-            risk_reward = return_at_target / 100  # Simplified: potential return vs 100% loss
-        else:
-            risk_reward = 0
+        # Risk/Reward score (higher is better): potential return vs 100% loss
+        risk_reward = np.where(return_at_target > 0, return_at_target / 100, 0)
         
-        return {
+        metrics = pd.DataFrame({
             'strike': strike,
-            'bid': round(bid, 2),
-            'ask': round(ask, 2),
-            'mid_price': round(mid_price, 2),
-            'last_price': round(last_price, 2),
+            'bid': bid,
+            'ask': ask,
+            'mid_price': mid_price,
+            'last_price': last_price,
             'volume': volume,
             'open_interest': open_interest,
-            'implied_volatility': round(implied_vol * 100, 1),
-            'delta': round(delta, 2) if delta else None,
-            'intrinsic': round(intrinsic, 2),
-            'extrinsic': round(extrinsic, 2),
-            'moneyness': round(moneyness, 1),
-            'moneyness_label': 'ITM' if moneyness > 2 else ('ATM' if moneyness > -2 else 'OTM'),
-            'break_even': round(break_even, 2),
+            'implied_volatility': implied_vol * 100,
+            'delta': delta,
+            'intrinsic': intrinsic,
+            'extrinsic': extrinsic,
+            'moneyness': moneyness,
+            'moneyness_label': np.select([moneyness > 2, moneyness > -2], ['ITM', 'ATM'], default='OTM'),
+            'break_even': break_even,
             'target_price': round(target_price, 2),
-            'return_at_target': round(return_at_target, 1),
+            'return_at_target': return_at_target,
             'max_loss': -100,
-            'leverage': round(leverage, 1),
-            'daily_theta_pct': round(daily_theta_pct, 3),
-            'liquidity_score': round(liquidity_score, 1),
-            'risk_reward': round(risk_reward, 2)
-        }
+            'leverage': leverage,
+            'daily_theta_pct': daily_theta_pct,
+            'liquidity_score': liquidity_score,
+            'risk_reward': risk_reward
+        })
+        
+        # Prices that round to zero are not usable either
+        return metrics[np.round(mid_price, 2) > 0].reset_index(drop=True)
     
     def find_optimal_options(self, num_recommendations: int = 1) -> Dict:
         """Find the best CALL option based on potential gain and value."""
@@ -203,24 +252,24 @@ class OptionsAnalyzer:
                 'options': []
             }
         
-        all_options = []
+        frames = []
         
-        for expiry in expiries:
-            calls, puts = self.get_options_chain(expiry)
-            
-            exp_date = datetime.strptime(expiry, '%Y-%m-%d')
-            days_to_exp = (exp_date - datetime.now()).days
-            
+        # One round trip per expiry; fetch the chains concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(expiries))) as executor:
+            chains = list(executor.map(self.get_options_chain, expiries))
+        
+        for (expiry, days_to_exp), (calls, puts) in zip(expiries.items(), chains):
             if calls is not None:
-                for _, row in calls.iterrows():
-                    metrics = self.calculate_option_metrics(row, True, target, days_to_exp)
-                    if metrics and metrics['mid_price'] > 0:
-                        metrics['expiry'] = expiry
-                        metrics['days_to_expiry'] = days_to_exp
-                        metrics['option_type'] = 'CALL'
-                        all_options.append(metrics)
-        
-        if not all_options:
+                # Calls struck above the target are worthless there; skip them and
+                # the deep ITM/OTM tails before computing metrics
+                strike = calls['strike']
+                calls = calls[(strike <= target) & strike.between(self.MIN_STRIKE_RATIO * self.current_price,
+                                                                  self.MAX_STRIKE_RATIO * self.current_price)]
+                metrics = self.calculate_option_metrics(calls, True, target, days_to_exp)
+                if not metrics.empty:
+                    frames.append(metrics.assign(expiry=expiry, days_to_expiry=days_to_exp, option_type='CALL'))
+        
+        if not frames:
             return {
                 'ticker': self.ticker,
                 'current_price': round(self.current_price, 2),
@@ -230,61 +279,47 @@ class OptionsAnalyzer:
             }
         
         # Score and rank options - optimized for best value and potential gain
-        for opt in all_options:
-            score = 0
-            
-            # HIGHEST WEIGHT: Potential return at target (50% weight)
-            # We want options with the best upside potential
-            if opt['return_at_target'] > 0:
-                score += min(50, opt['return_at_target'] / 4)  # Cap at 50 points for 200%+ return
-            
-            # VALUE: Prefer reasonable leverage 3-10x (15% weight)
-            # Sweet spot for risk/reward
-            if 4 <= opt['leverage'] <= 8:
-                score += 15
-            elif 3 <= opt['leverage'] <= 12:
-                score += 10
-            elif opt['leverage'] > 1:
-                score += 5
-            
-            # MONEYNESS: Prefer slightly OTM to ATM for best value (15% weight)
-            # Slightly OTM gives better leverage, ATM gives better probability
-            if -10 <= opt['moneyness'] <= 5:
-                score += 15  # Slightly OTM to ATM - best value zone
-            elif -15 <= opt['moneyness'] <= 10:
-                score += 10
-            elif -20 <= opt['moneyness'] <= 15:
-                score += 5
-            
-            # TIME: Prefer 9-18 months for LEAPS sweet spot (10% weight)
-            if 270 <= opt['days_to_expiry'] <= 540:
-                score += 10  # 9-18 months - ideal LEAPS range
-            elif 365 <= opt['days_to_expiry'] <= 730:
-                score += 8   # 1-2 years
-            elif opt['days_to_expiry'] >= 180:
-                score += 5
-            
-            # VALUE: Lower IV means cheaper options (5% weight)
-            if opt['implied_volatility'] < 35:
-                score += 5
-            elif opt['implied_volatility'] < 50:
-                score += 3
-            elif opt['implied_volatility'] < 70:
-                score += 1
-            
-            # LIQUIDITY: Prefer liquid options (5% weight)
-            if opt['liquidity_score'] > 50:
-                score += 5
-            elif opt['liquidity_score'] > 20:
-                score += 3
-            elif opt['liquidity_score'] > 5:
-                score += 1
-            
-            opt['score'] = round(score, 1)
+        # (thresholds apply to the metrics as displayed)
+        options_df = pd.concat(frames, ignore_index=True)
+        return_at_target = options_df['return_at_target'].round(1)
+        leverage = options_df['leverage'].round(1)
+        moneyness = options_df['moneyness'].round(1)
+        days_to_expiry = options_df['days_to_expiry']
+        implied_vol = options_df['implied_volatility'].round(1)
+        liquidity = options_df['liquidity_score'].round(1)
+        
+        # HIGHEST WEIGHT: Potential return at target (50% weight)
+        # We want options with the best upside potential (cap at 50 points for 200%+ return)
+        score = np.where(return_at_target > 0, np.minimum(50, return_at_target / 4), 0)
+        
+        # VALUE: Prefer reasonable leverage 3-10x (15% weight)
+        # Sweet spot for risk/reward
+        score += np.select(
+            [leverage.between(4, 8), leverage.between(3, 12), leverage > 1],
+            [15, 10, 5], default=0)
+        
+        # MONEYNESS: Prefer slightly OTM to ATM for best value (15% weight)
+        # Slightly OTM gives better leverage, ATM gives better probability
+        score += np.select(
+            [moneyness.between(-10, 5), moneyness.between(-15, 10), moneyness.between(-20, 15)],
+            [15, 10, 5], default=0)
         
-        # Sort by score and get THE BEST option only
-        all_options.sort(key=lambda x: x['score'], reverse=True)
-        best_option = all_options[:1]  # Only 1 option
+        # TIME: Prefer 9-18 months for LEAPS sweet spot (10% weight)
+        # 9-18 months is the ideal LEAPS range, then 1-2 years
+        score += np.select(
+            [days_to_expiry.between(270, 540), days_to_expiry.between(365, 730), days_to_expiry >= 180],
+            [10, 8, 5], default=0)
+        
+        # VALUE: Lower IV means cheaper options (5% weight)
+        score += np.select([implied_vol < 35, implied_vol < 50, implied_vol < 70], [5, 3, 1], default=0)
+        
+        # LIQUIDITY: Prefer liquid options (5% weight)
+        score += np.select([liquidity > 50, liquidity > 20, liquidity > 5], [5, 3, 1], default=0)
+        
+        options_df['score'] = np.round(score, 1)
+        
+        # Sort by score and get THE BEST option only, rounded for display
+        best_option = options_df.nlargest(1, 'score').round(self.METRIC_DECIMALS).to_dict('records')
         
         # Generate recommendation text
         if best_option:
@@ -303,30 +338,65 @@ class OptionsAnalyzer:
         }
 
 
-def analyze_options_for_signals(signals: List[Dict]) -> List[Dict]:
-    """Analyze CALL options for ALL stocks (user believes all will go up)."""
+def _parse_price_ranges(ranges: pd.Series) -> pd.DataFrame:
+    """Split "$low - $high" range strings into numeric columns 0 and 1 (NaN if unparseable)."""
+    bounds = ranges.str.replace('$', '', regex=False).str.split(' - ', expand=True)
+    return bounds.reindex(columns=[0, 1]).apply(pd.to_numeric, errors='coerce')
+
+
+def _analyze_signal_options(signal: Dict, buy_target: float, sell_target: float, use_cache: bool = True) -> Dict:
+    """Find the best CALL for a single signal."""
+    
+    if np.isnan(buy_target) or np.isnan(sell_target):
+        raise ValueError(f"could not parse price ranges {signal.get('buy_range')!r} / {signal.get('sell_range')!r}")
+    
+    analyzer = OptionsAnalyzer(
+        ticker=signal['ticker'],
+        current_price=signal['current_price'],
+        signal=signal['signal'],
+        sell_target=sell_target,
+        buy_target=buy_target,
+        use_cache=use_cache
+    )
+    
+    return analyzer.find_optimal_options(num_recommendations=1)
+
+
+def analyze_options_for_signals(signals: List[Dict], use_cache: bool = True, analyze_holds: bool = False) -> List[Dict]:
+    """Analyze CALL options for every actionable stock (user believes all will go up).
+    
+    HOLD signals are skipped unless analyze_holds is set.
+    """
     
     options_results = []
     
-    for signal in signals:
-        # Analyze ALL stocks, not just actionable ones
+    if not analyze_holds:
+        signals = [signal for signal in signals if signal['signal'] != 'HOLD']
+    
+    if not signals:
+        return options_results
+    
+    # Lower buy and upper sell targets; signals saved without the numeric
+    # targets fall back to parsing their range strings
+    targets = pd.DataFrame(signals, columns=['buy_target_low', 'sell_target_high', 'buy_range', 'sell_range'])
+    buy_targets = targets['buy_target_low'].astype(float)
+    sell_targets = targets['sell_target_high'].astype(float)
+    if buy_targets.isna().any() or sell_targets.isna().any():
+        buy_targets = buy_targets.fillna(_parse_price_ranges(targets['buy_range'])[0])
+        sell_targets = sell_targets.fillna(_parse_price_ranges(targets['sell_range'])[1])
+    buy_targets, sell_targets = buy_targets.tolist(), sell_targets.tolist()
+    
+    # Each ticker is independent network-bound work; run them concurrently and
+    # collect the futures in signal order
+    with ThreadPoolExecutor(max_workers=min(16, len(signals))) as executor:
+        futures = [
+            executor.submit(_analyze_signal_options, signal, buy_target, sell_target, use_cache)
+            for signal, buy_target, sell_target in zip(signals, buy_targets, sell_targets)
+        ]
+    
+    for signal, future in zip(signals, futures):
         try:
-            # Parse price targets from ranges
-            buy_range = signal['buy_range'].replace('$', '').split(' - ')
-            sell_range = signal['sell_range'].replace('$', '').split(' - ')
-            
-            buy_target = float(buy_range[0])  # Lower target
-            sell_target = float(sell_range[1])  # Upper target
-            
-            analyzer = OptionsAnalyzer(
-                ticker=signal['ticker'],
-                current_price=signal['current_price'],
-                signal=signal['signal'],
-                sell_target=sell_target,
-                buy_target=buy_target
-            )
-            
-            result = analyzer.find_optimal_options(num_recommendations=1)
+            result = future.result()
             options_results.append(result)
             
             if result['options']:
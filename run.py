@@ -9,6 +9,8 @@ Usage:
     python run.py --no-alerts  # Run without sending alerts
     python run.py --no-options # Run without options analysis
     python run.py --schedule   # Run on schedule (3x daily)
+    python run.py --no-cache   # Re-download price and options data instead of using the disk cache
+    python run.py --analyze-holds  # Also analyze options for HOLD signals
 """
 
 import argparse
@@ -17,12 +19,20 @@ from datetime import datetime
 import os
 import sys
 
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from signals import SignalEngine
 from alerts import AlertManager
-from dashboard import generate_dashboard
+from dashboard import generate_dashboard, json_safe
 
 
-def run_signal_generation(send_alerts: bool = True, analyze_options: bool = True, output_dir: str = '.') -> dict:
+def run_signal_generation(send_alerts: bool = True, analyze_options: bool = True, output_dir: str = '.',
+                          use_cache: bool = True, analyze_holds: bool = False) -> dict:
     """Run the full signal generation pipeline."""
     
     print("=" * 60)
@@ -33,7 +43,7 @@ def run_signal_generation(send_alerts: bool = True, analyze_options: bool = True
     
     # Initialize engine
     config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
-    engine = SignalEngine(config_path)
+    engine = SignalEngine(config_path, use_cache=use_cache)
     
     # Generate signals
     results = engine.generate_all_signals()
@@ -60,17 +70,25 @@ def run_signal_generation(send_alerts: bool = True, analyze_options: bool = True
         print("=" * 60)
         try:
             from options import analyze_options_for_signals
-            options_data = analyze_options_for_signals(results['signals'])
+            options_data = analyze_options_for_signals(results['signals'], use_cache=use_cache,
+                                                       analyze_holds=analyze_holds)
             
-            # Print options summary
-            print()
-            for opt_result in options_data:
-                if opt_result['options']:
-                    top_opt = opt_result['options'][0]
-                    print(f"  {opt_result['ticker']}: {opt_result['recommendation']}")
-                    print(f"    → Best: ${top_opt['strike']} {top_opt['option_type']} exp {top_opt['expiry']}")
-                    print(f"      Price: ${top_opt['mid_price']} | Return at target: {top_opt['return_at_target']:+.0f}%")
+            # Print options summary, one row per ticker; tickers without a pick
+            # still show their recommendation (no LEAPS, nothing suitable, error)
+            options_summary = pd.DataFrame(
+                [dict(r['options'][0] if r['options'] else {}, ticker=r['ticker'],
+                      recommendation=r['recommendation']) for r in options_data],
+                columns=['ticker', 'strike', 'option_type', 'expiry', 'mid_price', 'target_price', 'return_at_target',
+                         'recommendation']
+            )
             print()
+            if not options_summary.empty:
+                rec_width = options_summary['recommendation'].str.len().max()
+                print(options_summary.to_string(index=False, na_rep='', formatters={
+                    'return_at_target': lambda v: '' if pd.isna(v) else f'{v:+.0f}%',
+                    'recommendation': lambda v: v.ljust(rec_width)
+                }))
+                print()
         except Exception as e:
             print(f"⚠️ Options analysis failed: {e}")
             print("   Continuing without options data...")
@@ -82,11 +100,15 @@ def run_signal_generation(send_alerts: bool = True, analyze_options: bool = True
     
     # Save JSON results
     json_path = os.path.join(output_dir, 'signals.json')
-    results_with_options = results.copy()
     if options_data:
-        results_with_options['options'] = options_data
-    with open(json_path, 'w') as f:
-        json.dump(results_with_options, f, indent=2, default=str)
+        results['options'] = options_data
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                 orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(json_safe(results), f, indent=2, default=str, allow_nan=False)
     print(f"✅ JSON data saved: {json_path}")
     
     # Send alerts
@@ -143,8 +165,13 @@ def run_scheduler():
     print("Waiting for scheduled times... (Ctrl+C to stop)")
     
     while True:
+        # Sleep straight through to the next check instead of polling every minute
+        idle_seconds = schedule.idle_seconds()
+        if idle_seconds is None:
+            print("⚠️ No jobs scheduled, stopping")
+            break
+        time.sleep(max(1, idle_seconds))
         schedule.run_pending()
-        time.sleep(60)
 
 
 def main():
@@ -153,6 +180,8 @@ def main():
     parser.add_argument('--no-options', action='store_true', help='Skip options analysis')
     parser.add_argument('--schedule', action='store_true', help='Run on schedule (3x daily)')
     parser.add_argument('--output-dir', type=str, default='.', help='Output directory for files')
+    parser.add_argument('--no-cache', action='store_true', help='Skip the price history and options data disk caches')
+    parser.add_argument('--analyze-holds', action='store_true', help='Also analyze options for HOLD signals')
     
     args = parser.parse_args()
     
@@ -162,7 +191,9 @@ def main():
         run_signal_generation(
             send_alerts=not args.no_alerts,
             analyze_options=not args.no_options,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            use_cache=not args.no_cache,
+            analyze_holds=args.analyze_holds
         )
 
 
@@ -10,9 +10,77 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import yaml
+import os
+import pickle
+import time
+import pytz
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+if njit is None:
+    # Without numba the kernels run as plain numpy code
+    def _kernel(func):
+        return func
+    _batch_kernel = _kernel
+else:
+    _kernel = njit(cache=True, nogil=True, error_model='numpy')
+    _batch_kernel = njit(cache=True, nogil=True, error_model='numpy', parallel=True)
+
+
+# On-disk cache for downloaded price history, one file per ticker and day
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'history')
+MARKET_HOURS_TTL = 15 * 60        # Today's bar is still forming during the session
+
+
+def _history_is_fresh(saved_at: float) -> bool:
+    """Whether history saved at `saved_at` (epoch seconds) can still be used.
+    
+    During the session entries last MARKET_HOURS_TTL. Outside it they must
+    have been saved after the most recent close, so a bar cached while it
+    was still forming is never mistaken for the final one.
+    """
+    tz = pytz.timezone('America/New_York')
+    now = datetime.now(tz).replace(tzinfo=None)
+    if now.weekday() < 5 and (9, 30) <= (now.hour, now.minute) < (16, 0):
+        return time.time() - saved_at < MARKET_HOURS_TTL
+    
+    last_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
+    while last_close > now or last_close.weekday() >= 5:
+        last_close -= timedelta(days=1)
+    return datetime.fromtimestamp(saved_at, tz).replace(tzinfo=None) >= last_close
+
+
+def _history_cache_path(ticker: str, day: str) -> str:
+    return os.path.join(CACHE_DIR, day, f'{ticker}.pkl')
+
+
+def _load_cached_history(ticker: str, day: str) -> Optional[pd.DataFrame]:
+    """Cached history for a ticker on a given day, or None if missing or stale."""
+    try:
+        with open(_history_cache_path(ticker, day), 'rb') as f:
+            saved_at, data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        return None
+    return data if _history_is_fresh(saved_at) else None
+
+
+def _save_cached_history(ticker: str, day: str, data: pd.DataFrame):
+    path = _history_cache_path(ticker, day)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((time.time(), data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not cache price history for {ticker}: {e}")
+
 
 class MarketRegime:
     """Detects overall market conditions to contextualize individual stock signals."""
@@ -22,6 +90,14 @@ class MarketRegime:
     BEARISH = "BEARISH"
     CRASH = "CRASH"
     
+    # Signal strength multiplier for each regime
+    MODIFIERS = {
+        BULLISH: 1.0,
+        NEUTRAL: 0.7,
+        BEARISH: 0.4,
+        CRASH: 0.1
+    }
+    
     def __init__(self, spy_data: pd.DataFrame, qqq_data: pd.DataFrame, vix_level: float):
         self.spy = spy_data
         self.qqq = qqq_data
@@ -33,19 +109,27 @@ class MarketRegime:
         if isinstance(self.qqq.columns, pd.MultiIndex):
             self.qqq.columns = self.qqq.columns.get_level_values(0)
         
+        self._compute_tails()
         self.regime = self._detect_regime()
         self.details = self._get_details()
+        self._modifier = self.MODIFIERS.get(self.regime, 0.5)
+    
+    def _compute_tails(self):
+        """Latest SPY/QQQ closes and moving averages shared by the regime and its details."""
+        spy_close = self.spy['Close'].to_numpy(np.float64)
+        qqq_close = self.qqq['Close'].to_numpy(np.float64)
+        
+        self.spy_close = spy_close[-1]
+        self.spy_ma50 = _window_mean(spy_close, 50)
+        self.spy_ma200 = _window_mean(spy_close, 200)
+        self.qqq_close = qqq_close[-1]
+        self.qqq_ma50 = _window_mean(qqq_close, 50)
     
     def _detect_regime(self) -> str:
         """Determine market regime based on SPY trend, QQQ trend, and VIX levels."""
         
-        # Calculate moving averages
-        spy_close = self.spy['Close'].iloc[-1]
-        spy_ma50 = self.spy['Close'].rolling(50).mean().iloc[-1]
-        spy_ma200 = self.spy['Close'].rolling(200).mean().iloc[-1]
-        
-        qqq_close = self.qqq['Close'].iloc[-1]
-        qqq_ma50 = self.qqq['Close'].rolling(50).mean().iloc[-1]
+        spy_close, spy_ma50, spy_ma200 = self.spy_close, self.spy_ma50, self.spy_ma200
+        qqq_close, qqq_ma50 = self.qqq_close, self.qqq_ma50
         
         # SPY trend
         spy_above_50 = spy_close > spy_ma50
@@ -78,12 +162,8 @@ class MarketRegime:
     
     def _get_details(self) -> Dict:
         """Get detailed market metrics."""
-        spy_close = self.spy['Close'].iloc[-1]
-        spy_ma50 = self.spy['Close'].rolling(50).mean().iloc[-1]
-        spy_ma200 = self.spy['Close'].rolling(200).mean().iloc[-1]
-        
-        qqq_close = self.qqq['Close'].iloc[-1]
-        qqq_ma50 = self.qqq['Close'].rolling(50).mean().iloc[-1]
+        spy_close, spy_ma50, spy_ma200 = self.spy_close, self.spy_ma50, self.spy_ma200
+        qqq_close, qqq_ma50 = self.qqq_close, self.qqq_ma50
         
         return {
             'spy_price': round(spy_close, 2),
@@ -96,17 +176,58 @@ class MarketRegime:
     
     def get_signal_modifier(self) -> float:
         """Returns a multiplier to adjust signal strength based on market regime."""
-        modifiers = {
-            self.BULLISH: 1.0,
-            self.NEUTRAL: 0.7,
-            self.BEARISH: 0.4,
-            self.CRASH: 0.1
-        }
-        return modifiers.get(self.regime, 0.5)
+        return self._modifier
+
+
+def _rolling_sums(values: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Windowed sums, sums of squares and full-window mask from cumulative sums.
+    
+    Missing values contribute nothing; windows containing one are flagged
+    incomplete, matching pandas rolling with the default min_periods.
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    sums = np.concatenate(([0.0], np.cumsum(filled)))
+    squares = np.concatenate(([0.0], np.cumsum(filled * filled)))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    return (sums[period:] - sums[:-period], squares[period:] - squares[:-period],
+            (counts[period:] - counts[:-period]) == period)
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Full-length simple moving average (NaN until a full window is available)."""
+    sums, _, full = _rolling_sums(values, period)
+    mean = np.full(len(values), np.nan)
+    mean[period - 1:] = np.where(full, sums / period, np.nan)
+    return mean
+
+
+def _rolling_mean_std(values: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Full-length moving average and sample standard deviation."""
+    sums, squares, full = _rolling_sums(values, period)
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    window_mean = sums / period
+    variance = np.maximum(squares - sums * window_mean, 0.0) / (period - 1)
+    mean[period - 1:] = np.where(full, window_mean, np.nan)
+    std[period - 1:] = np.where(full, np.sqrt(variance), np.nan)
+    return mean, std
+
+
+def _rolling_extreme(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    """Full-length rolling reduction (min, max or mean) over short windows; NaN until a full window."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = reduce(np.lib.stride_tricks.sliding_window_view(values, period), axis=1)
+    return out
 
 
 class TechnicalIndicators:
-    """Calculate technical indicators for a stock."""
+    """Calculate technical indicators for a stock.
+    
+    Indicators are computed on the underlying float64 arrays and only wrapped
+    back into Series (on the data's index) when returned.
+    """
     
     def __init__(self, data: pd.DataFrame):
         self.data = data
@@ -115,66 +236,326 @@ class TechnicalIndicators:
         self.low = data['Low']
         self.volume = data['Volume']
         
+        self._close = self.close.to_numpy(np.float64)
+        self._high = self.high.to_numpy(np.float64)
+        self._low = self.low.to_numpy(np.float64)
+        self._volume = self.volume.to_numpy(np.float64)
+    
+    def _series(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(values, index=self.data.index)
+        
     def rsi(self, period: int = 14) -> pd.Series:
         """Relative Strength Index."""
-        delta = self.close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        delta = np.diff(self._close, prepend=np.nan)
+        gain = _rolling_mean(np.where(delta > 0, delta, 0.0), period)
+        loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
+        return self._series(100 - (100 / (1 + rs)))
     
     def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """MACD, Signal line, and Histogram."""
-        exp1 = self.close.ewm(span=fast, adjust=False).mean()
-        exp2 = self.close.ewm(span=slow, adjust=False).mean()
-        macd_line = exp1 - exp2
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        macd_line = _ema(self._close, fast) - _ema(self._close, slow)
+        signal_line = _ema(macd_line, signal)
         histogram = macd_line - signal_line
-        return macd_line, signal_line, histogram
+        return self._series(macd_line), self._series(signal_line), self._series(histogram)
     
     def bollinger_bands(self, period: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Bollinger Bands: upper, middle, lower."""
-        middle = self.close.rolling(window=period).mean()
-        std = self.close.rolling(window=period).std()
+        middle, std = _rolling_mean_std(self._close, period)
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
-        return upper, middle, lower
+        return self._series(upper), self._series(middle), self._series(lower)
     
     def sma(self, period: int) -> pd.Series:
         """Simple Moving Average."""
-        return self.close.rolling(window=period).mean()
+        return self._series(_rolling_mean(self._close, period))
     
     def ema(self, period: int) -> pd.Series:
         """Exponential Moving Average."""
-        return self.close.ewm(span=period, adjust=False).mean()
+        return self._series(_ema(self._close, period))
     
     def atr(self, period: int = 14) -> pd.Series:
         """Average True Range for volatility."""
-        high_low = self.high - self.low
-        high_close = abs(self.high - self.close.shift())
-        low_close = abs(self.low - self.close.shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        return true_range.rolling(window=period).mean()
+        prev_close = np.empty_like(self._close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = self._close[:-1]
+        # fmax skips the missing previous close on the first bar, as max(axis=1) did
+        true_range = np.fmax(self._high - self._low,
+                             np.fmax(np.abs(self._high - prev_close), np.abs(self._low - prev_close)))
+        return self._series(_rolling_mean(true_range, period))
     
     def volume_sma(self, period: int = 20) -> pd.Series:
         """Volume Simple Moving Average."""
-        return self.volume.rolling(window=period).mean()
+        return self._series(_rolling_mean(self._volume, period))
     
     def stochastic(self, k_period: int = 14, d_period: int = 3) -> Tuple[pd.Series, pd.Series]:
         """Stochastic Oscillator %K and %D."""
-        lowest_low = self.low.rolling(window=k_period).min()
-        highest_high = self.high.rolling(window=k_period).max()
-        k = 100 * (self.close - lowest_low) / (highest_high - lowest_low)
-        d = k.rolling(window=d_period).mean()
-        return k, d
+        lowest_low = _rolling_extreme(self._low, k_period, np.min)
+        highest_high = _rolling_extreme(self._high, k_period, np.max)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = 100 * (self._close - lowest_low) / (highest_high - lowest_low)
+        d = _rolling_extreme(k, d_period, np.mean)
+        return self._series(k), self._series(d)
     
     def support_resistance(self, lookback: int = 20) -> Tuple[float, float]:
         """Simple support/resistance based on recent highs/lows."""
-        recent_high = self.high.tail(lookback).max()
-        recent_low = self.low.tail(lookback).min()
+        recent_high = np.nanmax(self._high[-lookback:]) if len(self._high) else np.nan
+        recent_low = np.nanmin(self._low[-lookback:]) if len(self._low) else np.nan
         return recent_low, recent_high
 
 
+# Tail-only indicator kernels
+# ---------------------------
+# StockSignal only needs the latest (and sometimes previous) value of each
+# indicator, so these work on float64 arrays and only touch the trailing window.
+# They stick to the numpy subset numba can compile.
+
+@_kernel
+def _window_mean(values: np.ndarray, period: int, offset: int = 0) -> float:
+    """Mean of the `period` values ending `offset` bars before the last one (NaN if too short)."""
+    end = len(values) - offset
+    if end < period:
+        return np.nan
+    return values[end - period:end].mean()
+
+
+@_kernel
+def _rsi_last(close: np.ndarray, period: int = 14) -> Tuple[float, float]:
+    """Latest and previous RSI (simple moving average of gains and losses)."""
+    # Price changes for the last period + 1 bars; the very first bar has no
+    # change and, like missing values, counts as zero
+    tail = close[-period - 2:]
+    delta = np.diff(tail)
+    if len(tail) == len(close):
+        delta = np.concatenate((np.zeros(1), delta))
+    delta[np.isnan(delta)] = 0.0
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    
+    rsi = 100 - 100 / (1 + _window_mean(gain, period) / _window_mean(loss, period))
+    rsi_prev = 100 - 100 / (1 + _window_mean(gain, period, 1) / _window_mean(loss, period, 1))
+    return rsi, rsi_prev
+
+
+@_kernel
+def _ewma(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average (adjust=False) as an explicit recurrence.
+    
+    Follows pandas' ewm(span, adjust=False).mean() step for step, including
+    how missing values decay the weight of the running average.
+    """
+    alpha = 1.0 / (1.0 + (span - 1) / 2.0)
+    out = np.empty(len(values))
+    if len(values) == 0:
+        return out
+    
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, len(values)):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= 1.0 - alpha
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+if njit is None:
+    def _ema(values: np.ndarray, span: int) -> np.ndarray:
+        """Exponential moving average (adjust=False) over the whole array."""
+        # A pure-Python recurrence would be slower than pandas' compiled ewm
+        return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+else:
+    _ema = _ewma
+
+
+@_kernel
+def _macd_last(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[float, float, float, float]:
+    """Latest MACD line, signal line and histogram, plus the previous histogram."""
+    macd_line = _ema(close, fast) - _ema(close, slow)
+    signal_line = _ema(macd_line, signal)
+    hist = macd_line[-2:] - signal_line[-2:]
+    return macd_line[-1], signal_line[-1], hist[-1], hist[0]
+
+
+@_kernel
+def _bollinger_last(close: np.ndarray, period: int = 20, std_dev: float = 2.0) -> Tuple[float, float, float]:
+    """Latest Bollinger Bands: upper, middle, lower."""
+    if len(close) < period:
+        return np.nan, np.nan, np.nan
+    window = close[-period:]
+    middle = window.mean()
+    std = np.sqrt(((window - middle) ** 2).sum() / (period - 1))  # Sample std, as pandas rolling
+    return middle + std * std_dev, middle, middle - std * std_dev
+
+
+@_kernel
+def _atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> float:
+    """Latest Average True Range."""
+    if len(close) < period:
+        return np.nan
+    
+    # The first bar has no previous close; its true range is just high - low
+    prev_close = np.full(period, np.nan)
+    available = close[-period - 1:-1]
+    prev_close[period - len(available):] = available
+    
+    recent_high = high[-period:]
+    recent_low = low[-period:]
+    true_range = np.fmax(recent_high - recent_low,
+                         np.fmax(np.abs(recent_high - prev_close), np.abs(recent_low - prev_close)))
+    return true_range.mean()
+
+
+@_kernel
+def _stochastic_last(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     k_period: int = 14, d_period: int = 3) -> Tuple[float, float]:
+    """Latest Stochastic Oscillator %K and %D."""
+    n_k = min(d_period, len(close) - k_period + 1)
+    if n_k < 1:
+        return np.nan, np.nan
+    
+    # %K for each of the last d_period bars
+    k = np.empty(n_k)
+    for i in range(n_k):
+        end = len(close) - n_k + 1 + i
+        lowest_low = low[end - k_period:end].min()
+        highest_high = high[end - k_period:end].max()
+        k[i] = 100 * (close[end - 1] - lowest_low) / (highest_high - lowest_low)
+    
+    if n_k < d_period:
+        return k[-1], np.nan
+    return k[-1], k.mean()
+
+
+# Columns of the indicator table, one row per ticker
+INDICATOR_FIELDS = ('rsi', 'rsi_prev', 'bb_upper', 'bb_middle', 'bb_lower', 'sma_20', 'sma_50', 'sma_200',
+                    'avg_volume', 'atr', 'stoch_k', 'stoch_d', 'support', 'resistance',
+                    'macd', 'macd_signal', 'macd_hist', 'macd_hist_prev', 'ema_9', 'ema_21')
+N_FIELDS = len(INDICATOR_FIELDS)
+
+
+@_batch_kernel
+def _indicator_table(close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray,
+                     lengths: np.ndarray) -> np.ndarray:
+    """Tail indicators for a stack of price histories in one pass.
+    
+    Inputs are (n_tickers, n_days) arrays holding each history left-aligned
+    in the first lengths[i] columns; returns one INDICATOR_FIELDS row per ticker.
+    """
+    table = np.empty((close.shape[0], N_FIELDS))
+    for i in prange(close.shape[0]):
+        n = lengths[i]
+        c, h, lo = close[i, :n], high[i, :n], low[i, :n]
+        
+        table[i, 0], table[i, 1] = _rsi_last(c)
+        table[i, 2], table[i, 3], table[i, 4] = _bollinger_last(c)
+        table[i, 5] = _window_mean(c, 20)
+        table[i, 6] = _window_mean(c, 50)
+        table[i, 7] = _window_mean(c, 200)
+        table[i, 8] = _window_mean(volume[i, :n], 20)
+        table[i, 9] = _atr_last(h, lo, c)
+        table[i, 10], table[i, 11] = _stochastic_last(h, lo, c)
+        table[i, 12] = np.nanmin(lo[-20:])
+        table[i, 13] = np.nanmax(h[-20:])
+        table[i, 14], table[i, 15], table[i, 16], table[i, 17] = _macd_last(c)
+        table[i, 18] = _ema(c, 9)[-1]
+        table[i, 19] = _ema(c, 21)[-1]
+    return table
+
+
+def compute_indicator_table(histories: List[pd.DataFrame]) -> np.ndarray:
+    """Stack OHLCV histories and compute their tail indicators in one batch (see INDICATOR_FIELDS)."""
+    lengths = np.array([len(data) for data in histories], dtype=np.int64)
+    shape = (len(histories), max(lengths, default=0))
+    close, high, low, volume = (np.full(shape, np.nan) for _ in range(4))
+    
+    for i, data in enumerate(histories):
+        n = lengths[i]
+        close[i, :n] = data['Close'].to_numpy(np.float64)
+        high[i, :n] = data['High'].to_numpy(np.float64)
+        low[i, :n] = data['Low'].to_numpy(np.float64)
+        volume[i, :n] = data['Volume'].to_numpy(np.float64)
+    
+    return _indicator_table(close, high, low, volume, lengths)
+
+
+def _warm_up_kernels():
+    """Compile the numba kernels now rather than on the first ticker.
+    
+    Kernels are compiled with cache=True, so after the first process this
+    mostly loads them from numba's on-disk cache. A no-op without numba.
+    """
+    if njit is None:
+        return
+    dummy = np.linspace(100.0, 130.0, 300)[np.newaxis, :]
+    _indicator_table(dummy, dummy + 1, dummy - 1, dummy, np.array([300], dtype=np.int64))
+
+
+# Weight of each indicator score in the composite
+SCORE_WEIGHTS = {
+    'rsi': 0.20,
+    'macd': 0.25,
+    'bollinger': 0.15,
+    'ma': 0.25,
+    'volume': 0.10,
+    'stochastic': 0.05
+}
+
+
+def _indicator_scores(price, rsi, macd, macd_signal, macd_hist, macd_hist_prev, bb_upper, bb_lower,
+                      sma_20, sma_50, sma_200, ema_9, ema_21, volume_ratio, stoch_k, stoch_d,
+                      rsi_oversold, rsi_overbought, volume_surge) -> Tuple:
+    """Score every indicator in one pass, in SCORE_WEIGHTS order.
+    
+    Works element-wise, so the inputs can be one ticker's scalars or
+    per-ticker arrays. A NaN sma_200 (under 200 bars of history) is left
+    out of the moving-average score.
+    """
+    # RSI (-1 to 1): oversold is bullish, overbought bearish, the neutral zone scores 0
+    rsi_score = np.where(rsi < rsi_oversold, np.minimum(1.0, (rsi_oversold - rsi) / 15),
+                         np.where(rsi > rsi_overbought, np.maximum(-1.0, (rsi_overbought - rsi) / 15), 0.0))
+    
+    # MACD (-1 to 1): histogram momentum plus crossover
+    hist_momentum = np.select([(macd_hist > 0) & (macd_hist > macd_hist_prev),
+                               (macd_hist < 0) & (macd_hist < macd_hist_prev)],
+                              [0.5, -0.5], 0.0)
+    crossover = np.select([(macd > macd_signal) & (macd_hist > 0),
+                           (macd < macd_signal) & (macd_hist < 0)],
+                          [0.5, -0.5], 0.0)
+    macd_score = hist_momentum + crossover
+    
+    # Bollinger Bands (-1 to 1): near the lower band is bullish, near the upper band bearish
+    position = (price - bb_lower) / (bb_upper - bb_lower)
+    bollinger_score = np.select([position < 0.1, position > 0.9, position < 0.3, position > 0.7],
+                                [0.8, -0.8, 0.3, -0.3], 0.0)
+    
+    # Moving averages (-1 to 1): price vs MAs, then the EMA crossover
+    ma_score = np.clip(np.where(price > sma_20, 0.2, -0.2)
+                       + np.where(price > sma_50, 0.3, -0.3)
+                       + np.where(np.isnan(sma_200), 0.0, np.where(price > sma_200, 0.3, -0.3))
+                       + np.where(ema_9 > ema_21, 0.2, -0.2), -1.0, 1.0)
+    
+    # Volume (-0.1 to 0.3): high volume amplifies other signals, low volume means less conviction
+    volume_score = np.select([volume_ratio > volume_surge, volume_ratio > 1.0], [0.3, 0.1], -0.1)
+    
+    # Stochastic (-0.5 to 0.5): oversold, overbought, then crossovers in the lower and upper halves
+    stochastic_score = np.select([(stoch_k < 20) & (stoch_d < 20),
+                                  (stoch_k > 80) & (stoch_d > 80),
+                                  (stoch_k > stoch_d) & (stoch_k < 50),
+                                  (stoch_k < stoch_d) & (stoch_k > 50)],
+                                 [0.5, -0.5, 0.2, -0.2], 0.0)
+    
+    return rsi_score, macd_score, bollinger_score, ma_score, volume_score, stochastic_score
+
+
 class StockSignal:
     """Generate trading signals for a single stock."""
     
@@ -184,191 +565,63 @@ class StockSignal:
     STRONG_BUY = "STRONG BUY"
     STRONG_SELL = "STRONG SELL"
     
-    def __init__(self, ticker: str, data: pd.DataFrame, sector: str, config: Dict):
+    def __init__(self, ticker: str, data: pd.DataFrame, sector: str, config: Dict,
+                 indicators: Optional[np.ndarray] = None):
         self.ticker = ticker
         self.data = data
         self.sector = sector
         self.config = config
-        self.indicators = TechnicalIndicators(data)
         self.thresholds = config.get('thresholds', {})
         
+        # Scoring thresholds, resolved once
+        self.rsi_oversold = float(self.thresholds.get('rsi_oversold', 30))
+        self.rsi_overbought = float(self.thresholds.get('rsi_overbought', 70))
+        self.volume_surge = float(self.thresholds.get('volume_surge', 1.5))
+        
+        # Raw price arrays; indicators only read their trailing windows
+        self.close = data['Close'].to_numpy(np.float64)
+        self.high = data['High'].to_numpy(np.float64)
+        self.low = data['Low'].to_numpy(np.float64)
+        self.volume = data['Volume'].to_numpy(np.float64)
+        
         # Current values
-        self.current_price = data['Close'].iloc[-1]
-        self.prev_close = data['Close'].iloc[-2] if len(data) > 1 else self.current_price
+        self.current_price = self.close[-1]
+        self.prev_close = self.close[-2] if len(self.close) > 1 else self.current_price
         
-        # Calculate all indicators
-        self._calculate_indicators()
+        # Calculate all indicators (or take this ticker's row of a batch-computed table)
+        if indicators is None:
+            indicators = compute_indicator_table([data])[0]
+        self._calculate_indicators(indicators)
         
-    def _calculate_indicators(self):
+    def _calculate_indicators(self, indicators: np.ndarray):
         """Pre-calculate all technical indicators."""
-        # RSI
-        rsi_series = self.indicators.rsi()
-        self.rsi = rsi_series.iloc[-1]
-        self.rsi_prev = rsi_series.iloc[-2] if len(rsi_series) > 1 else self.rsi
-        
-        # MACD
-        macd, signal, hist = self.indicators.macd()
-        self.macd = macd.iloc[-1]
-        self.macd_signal = signal.iloc[-1]
-        self.macd_hist = hist.iloc[-1]
-        self.macd_hist_prev = hist.iloc[-2] if len(hist) > 1 else self.macd_hist
-        
-        # Bollinger Bands
-        upper, middle, lower = self.indicators.bollinger_bands()
-        self.bb_upper = upper.iloc[-1]
-        self.bb_middle = middle.iloc[-1]
-        self.bb_lower = lower.iloc[-1]
-        self.bb_width = (self.bb_upper - self.bb_lower) / self.bb_middle
+        # RSI, Bollinger Bands, SMAs, volume average, ATR, Stochastic, Support/Resistance,
+        # MACD and Exponential Moving Averages
+        (self.rsi, self.rsi_prev, self.bb_upper, self.bb_middle, self.bb_lower,
+         self.sma_20, self.sma_50, self.sma_200, self.avg_volume, self.atr,
+         self.stoch_k, self.stoch_d, self.support, self.resistance,
+         self.macd, self.macd_signal, self.macd_hist, self.macd_hist_prev,
+         self.ema_9, self.ema_21) = indicators
         
-        # Moving Averages
-        self.sma_20 = self.indicators.sma(20).iloc[-1]
-        self.sma_50 = self.indicators.sma(50).iloc[-1]
-        self.sma_200 = self.indicators.sma(200).iloc[-1] if len(self.data) >= 200 else None
-        self.ema_9 = self.indicators.ema(9).iloc[-1]
-        self.ema_21 = self.indicators.ema(21).iloc[-1]
+        self.bb_width = (self.bb_upper - self.bb_lower) / self.bb_middle
         
         # Volume
-        self.current_volume = self.data['Volume'].iloc[-1]
-        self.avg_volume = self.indicators.volume_sma(20).iloc[-1]
+        self.current_volume = self.volume[-1]
         self.volume_ratio = self.current_volume / self.avg_volume if self.avg_volume > 0 else 1
         
-        # ATR for price targets
-        self.atr = self.indicators.atr().iloc[-1]
-        
-        # Stochastic
-        k, d = self.indicators.stochastic()
-        self.stoch_k = k.iloc[-1]
-        self.stoch_d = d.iloc[-1]
-        
-        # Support/Resistance
-        self.support, self.resistance = self.indicators.support_resistance()
-        
-    def _score_rsi(self) -> float:
-        """Score based on RSI. Returns -1 to 1."""
-        oversold = self.thresholds.get('rsi_oversold', 30)
-        overbought = self.thresholds.get('rsi_overbought', 70)
-        
-        if self.rsi < oversold:
-            # Oversold - bullish signal
-            return min(1.0, (oversold - self.rsi) / 15)
-        elif self.rsi > overbought:
-            # Overbought - bearish signal
-            return max(-1.0, (overbought - self.rsi) / 15)
-        else:
-            # Neutral zone
-            return 0.0
-    
-    def _score_macd(self) -> float:
-        """Score based on MACD crossover and histogram. Returns -1 to 1."""
-        # Histogram momentum
-        hist_momentum = 0.0
-        if self.macd_hist > 0 and self.macd_hist > self.macd_hist_prev:
-            hist_momentum = 0.5  # Bullish momentum increasing
-        elif self.macd_hist < 0 and self.macd_hist < self.macd_hist_prev:
-            hist_momentum = -0.5  # Bearish momentum increasing
-            
-        # Crossover signal
-        crossover = 0.0
-        if self.macd > self.macd_signal and self.macd_hist > 0:
-            crossover = 0.5  # Bullish crossover
-        elif self.macd < self.macd_signal and self.macd_hist < 0:
-            crossover = -0.5  # Bearish crossover
-            
-        return hist_momentum + crossover
-    
-    def _score_bollinger(self) -> float:
-        """Score based on Bollinger Band position. Returns -1 to 1."""
-        position = (self.current_price - self.bb_lower) / (self.bb_upper - self.bb_lower)
-        
-        if position < 0.1:
-            return 0.8  # Near lower band - bullish
-        elif position > 0.9:
-            return -0.8  # Near upper band - bearish
-        elif position < 0.3:
-            return 0.3
-        elif position > 0.7:
-            return -0.3
-        else:
-            return 0.0
-    
-    def _score_moving_averages(self) -> float:
-        """Score based on moving average alignment. Returns -1 to 1."""
-        score = 0.0
-        
-        # Price vs MAs
-        if self.current_price > self.sma_20:
-            score += 0.2
-        else:
-            score -= 0.2
-            
-        if self.current_price > self.sma_50:
-            score += 0.3
-        else:
-            score -= 0.3
-            
-        if self.sma_200 is not None:
-            if self.current_price > self.sma_200:
-                score += 0.3
-            else:
-                score -= 0.3
-                
-        # EMA crossover
-        if self.ema_9 > self.ema_21:
-            score += 0.2
-        else:
-            score -= 0.2
-            
-        return max(-1.0, min(1.0, score))
-    
-    def _score_volume(self) -> float:
-        """Score based on volume confirmation. Returns 0 to 0.5."""
-        surge_threshold = self.thresholds.get('volume_surge', 1.5)
-        
-        if self.volume_ratio > surge_threshold:
-            # High volume - amplifies other signals
-            return 0.3
-        elif self.volume_ratio > 1.0:
-            return 0.1
-        else:
-            return -0.1  # Below average volume - less conviction
-    
-    def _score_stochastic(self) -> float:
-        """Score based on Stochastic oscillator. Returns -0.5 to 0.5."""
-        if self.stoch_k < 20 and self.stoch_d < 20:
-            return 0.5  # Oversold
-        elif self.stoch_k > 80 and self.stoch_d > 80:
-            return -0.5  # Overbought
-        elif self.stoch_k > self.stoch_d and self.stoch_k < 50:
-            return 0.2  # Bullish crossover in lower half
-        elif self.stoch_k < self.stoch_d and self.stoch_k > 50:
-            return -0.2  # Bearish crossover in upper half
-        return 0.0
-    
     def calculate_composite_score(self, market_modifier: float = 1.0) -> float:
         """Calculate weighted composite score from all indicators."""
         
-        # Weights for each indicator
-        weights = {
-            'rsi': 0.20,
-            'macd': 0.25,
-            'bollinger': 0.15,
-            'ma': 0.25,
-            'volume': 0.10,
-            'stochastic': 0.05
-        }
-        
         # Calculate individual scores
-        scores = {
-            'rsi': self._score_rsi(),
-            'macd': self._score_macd(),
-            'bollinger': self._score_bollinger(),
-            'ma': self._score_moving_averages(),
-            'volume': self._score_volume(),
-            'stochastic': self._score_stochastic()
-        }
+        scores = dict(zip(SCORE_WEIGHTS, map(float, _indicator_scores(
+            self.current_price, self.rsi, self.macd, self.macd_signal, self.macd_hist, self.macd_hist_prev,
+            self.bb_upper, self.bb_lower, self.sma_20, self.sma_50,
+            self.sma_200,
+            self.ema_9, self.ema_21, self.volume_ratio, self.stoch_k, self.stoch_d,
+            self.rsi_oversold, self.rsi_overbought, self.volume_surge))))
         
         # Weighted sum
-        raw_score = sum(scores[k] * weights[k] for k in weights)
+        raw_score = sum(scores[k] * weight for k, weight in SCORE_WEIGHTS.items())
         
         # Apply market regime modifier
         adjusted_score = raw_score * market_modifier
@@ -423,6 +676,10 @@ class StockSignal:
             'daily_change': round(daily_change, 2),
             'buy_range': f"${buy_target_low} - ${buy_target_high}",
             'sell_range': f"${sell_target_low} - ${sell_target_high}",
+            'buy_target_low': buy_target_low,
+            'buy_target_high': buy_target_high,
+            'sell_target_low': sell_target_low,
+            'sell_target_high': sell_target_high,
             'support': round(self.support, 2),
             'resistance': round(self.resistance, 2),
             'indicators': {
@@ -438,13 +695,33 @@ class StockSignal:
         }
 
 
+# Index data used for the market regime
+MARKET_TICKERS = ['SPY', 'QQQ', '^VIX']
+
+# Signal types, strongest buy to strongest sell
+SIGNAL_TYPES = [StockSignal.STRONG_BUY, StockSignal.BUY, StockSignal.HOLD, StockSignal.SELL, StockSignal.STRONG_SELL]
+
+
+def signals_frame(signals: List[Dict]) -> pd.DataFrame:
+    """Columnar view of signal dicts: one row per signal, nested fields flattened (e.g. 'indicators.rsi')."""
+    frame = pd.json_normalize(signals) if signals else pd.DataFrame(columns=['ticker', 'signal'])
+    frame['signal'] = pd.Categorical(frame['signal'], categories=SIGNAL_TYPES)
+    return frame
+
+
 class SignalEngine:
     """Main engine to generate signals for all stocks."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', use_cache: bool = True, warmup: bool = False):
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
         
+        self.use_cache = use_cache
+        
+        # Indicator kernels otherwise compile lazily on first use
+        if warmup:
+            _warm_up_kernels()
+        
         self.watchlist = self.config.get('watchlist', {})
         self.all_tickers = self._flatten_watchlist()
         self.lookback_days = self.config.get('data', {}).get('lookback_days', 100)
@@ -457,50 +734,77 @@ class SignalEngine:
                 tickers.append((stock, sector))
         return tickers
     
-    def fetch_market_data(self) -> MarketRegime:
-        """Fetch market index data and determine regime."""
+    def fetch_history(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Fetch a year of daily history for many tickers in one batched download.
+        
+        Tickers already cached on disk for today are read from the cache and
+        left out of the download.
+        """
         end_date = datetime.now()
         start_date = end_date - timedelta(days=365)  # Need 200 days for MA
+        day = end_date.strftime('%Y-%m-%d')
         
-        spy = yf.download('SPY', start=start_date, end=end_date, progress=False)
-        qqq = yf.download('QQQ', start=start_date, end=end_date, progress=False)
-        vix = yf.download('^VIX', start=start_date, end=end_date, progress=False)
+        history = {}
+        if self.use_cache:
+            for ticker in tickers:
+                data = _load_cached_history(ticker, day)
+                if data is not None:
+                    history[ticker] = data
         
-        # Handle both single and multi-level column formats from yfinance
-        if isinstance(spy.columns, pd.MultiIndex):
-            spy.columns = spy.columns.get_level_values(0)
-            qqq.columns = qqq.columns.get_level_values(0)
-            vix.columns = vix.columns.get_level_values(0)
+        missing = [ticker for ticker in tickers if ticker not in history]
+        if not missing:
+            return history
+        
+        try:
+            raw = yf.download(missing, start=start_date, end=end_date, group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            print(f"Error fetching {', '.join(missing)}: {e}")
+            return history
+        
+        # Columns are (ticker, field); split them back into one frame per ticker
+        if not isinstance(raw.columns, pd.MultiIndex):
+            downloaded = {missing[0]: raw}
+        else:
+            downloaded = {}
+            for ticker in missing:
+                if ticker in raw.columns.get_level_values(0):
+                    # The batch covers every date any ticker traded; drop the ones this ticker didn't
+                    downloaded[ticker] = raw[ticker].dropna(how='all')
+        
+        for ticker, data in downloaded.items():
+            if self.use_cache and not data.empty:
+                _save_cached_history(ticker, day, data)
+            history[ticker] = data
+        return history
+    
+    def fetch_market_data(self, history: Optional[Dict[str, pd.DataFrame]] = None) -> MarketRegime:
+        """Determine market regime from SPY, QQQ and VIX history (fetched if not given)."""
+        if history is None:
+            history = self.fetch_history(MARKET_TICKERS)
+        
+        spy, qqq, vix = (history[ticker] for ticker in MARKET_TICKERS)
         
         # Extract scalar value for VIX
         vix_level = float(vix['Close'].iloc[-1])
         
         return MarketRegime(spy, qqq, vix_level)
     
-    def fetch_stock_data(self, ticker: str) -> Optional[pd.DataFrame]:
-        """Fetch historical data for a single stock."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        try:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-            if len(data) < 50:
-                print(f"Warning: Insufficient data for {ticker}")
-                return None
-            
-            # Handle both single and multi-level column formats from yfinance
-            if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.get_level_values(0)
-            
-            return data
-        except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
+    def fetch_stock_data(self, ticker: str, history: Optional[Dict[str, pd.DataFrame]] = None) -> Optional[pd.DataFrame]:
+        """Historical data for a single stock, taken from `history` or fetched."""
+        if history is None:
+            history = self.fetch_history([ticker])
+        
+        data = history.get(ticker)
+        if data is None or len(data) < 50:
+            print(f"Warning: Insufficient data for {ticker}")
             return None
+        return data
     
     def generate_all_signals(self) -> Dict:
         """Generate signals for all stocks in watchlist."""
         print("Fetching market data...")
-        market_regime = self.fetch_market_data()
+        history = self.fetch_history([ticker for ticker, _ in self.all_tickers] + MARKET_TICKERS)
+        market_regime = self.fetch_market_data(history)
         
         print(f"Market Regime: {market_regime.regime}")
         print(f"VIX: {market_regime.details['vix']}")
@@ -514,38 +818,35 @@ class SignalEngine:
                 'modifier': market_regime.get_signal_modifier()
             },
             'signals': [],
-            'summary': {
-                'strong_buy': [],
-                'buy': [],
-                'hold': [],
-                'sell': [],
-                'strong_sell': []
-            },
+            'summary': {},
             'generated_at': datetime.now().isoformat()
         }
         
         print(f"Analyzing {len(self.all_tickers)} stocks...")
         
+        stocks = []
         for ticker, sector in self.all_tickers:
-            data = self.fetch_stock_data(ticker)
-            if data is None:
-                continue
-                
+            data = self.fetch_stock_data(ticker, history)
+            if data is not None:
+                stocks.append((ticker, sector, data))
+        
+        # Indicators for the whole watchlist in one batch
+        indicator_table = compute_indicator_table([data for _, _, data in stocks])
+        
+        for (ticker, sector, data), indicators in zip(stocks, indicator_table):
             try:
-                signal_gen = StockSignal(ticker, data, sector, self.config)
+                signal_gen = StockSignal(ticker, data, sector, self.config, indicators=indicators)
                 signal = signal_gen.generate_signal(market_regime)
                 results['signals'].append(signal)
-                
-                # Categorize
-                signal_type = signal['signal'].lower().replace(' ', '_')
-                if signal_type in results['summary']:
-                    results['summary'][signal_type].append(ticker)
-                    
                 print(f"  {ticker}: {signal['signal']} (confidence: {signal['confidence']}%)")
                 
             except Exception as e:
                 print(f"  Error analyzing {ticker}: {e}")
         
+        # Categorize
+        by_signal = signals_frame(results['signals']).groupby('signal', observed=False)['ticker'].agg(list)
+        results['summary'] = {signal.lower().replace(' ', '_'): tickers for signal, tickers in by_signal.items()}
+        
         return results
     
     def get_actionable_signals(self, results: Dict) -> List[Dict]: